@@ -1,5 +1,5 @@
 from fastapi import FastAPI
-from src.api.routes import router
+from src.api.routes import router, get_ml_batcher
 
 app = FastAPI(
     title="Option Pricing & Risk Engine",
@@ -8,3 +8,8 @@ app = FastAPI(
 )
 
 app.include_router(router)
+
+
+@app.on_event("startup")
+def load_ml_model():
+    get_ml_batcher()
@@ -16,16 +16,19 @@ import secrets
 import string
 import sys
 
-from src.config import TICKERS, RISK_FREE_RATE
+from src.config import TICKERS, RISK_FREE_RATE, RANDOM_STATE, MODEL_REGISTRY_DIR, MODEL_REGISTRY_MAX_BYTES
 from src.data_loader import load_stock_data
-from src.volatility import historical_volatility
-from src.black_scholes import call_price
-from src.greeks import calculate_greeks
+from src.volatility import historical_volatility, volatility_history
+from src.black_scholes import call_price, put_price
+from src.batch_pricing import price_batch
+from src.scalar_pricing import is_scalar, price_scalar
+from src.greeks import calculate_greeks, second_order_pnl
 from src.hedge import delta_hedge
 from src.feature_engineering import generate_option_samples
 from src.ml_model import train_model
+from src.model_registry import ModelRegistry
 from src.option_chain import load_option_chain
-from src.vol_surface import approximate_vol_surface
+from src.vol_surface import approximate_vol_surface, svi_surface
 
 # =============================
 # DATABASE SETUP & AUTHENTICATION
@@ -671,40 +674,30 @@ def show_login_page():
 
 # ... [Keep all your original functions like put_price, calculate_all_greeks, etc.] ...
 
-def put_price(S, K, T, r, sigma):
-    """Calculate put option price using put-call parity"""
-    call = call_price(S, K, T, r, sigma)
-    return call + K * np.exp(-r * T) - S
+@st.cache_resource
+def get_model_registry():
+    """One registry per server process so its in-memory LRU survives reruns"""
+    return ModelRegistry(MODEL_REGISTRY_DIR, max_bytes=MODEL_REGISTRY_MAX_BYTES)
+
+@st.cache_data
+def get_volatility_history(returns):
+    """Rolling/EWMA/GARCH series, recomputed only when the returns change"""
+    return volatility_history(returns)
 
 def calculate_all_greeks(S, K, T, r, sigma, option_type="call"):
     """Calculate all Greeks for risk analysis"""
-    from scipy.stats import norm
-    
-    d1 = (np.log(S / K) + (r + 0.5 * sigma ** 2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    pdf_d1 = norm.pdf(d1)
-    
-    if option_type.lower() == "call":
-        delta = norm.cdf(d1)
-        gamma = pdf_d1 / (S * sigma * np.sqrt(T))
-        vega = S * pdf_d1 * np.sqrt(T) / 100
-        theta = (-S * pdf_d1 * sigma / (2 * np.sqrt(T)) 
-                 - r * K * np.exp(-r * T) * norm.cdf(d2)) / 365
-        rho = K * T * np.exp(-r * T) * norm.cdf(d2) / 100
+    if is_scalar(S, K, T, r, sigma):
+        greeks = price_scalar(S, K, T, r, sigma, option_type)
     else:
-        delta = norm.cdf(d1) - 1
-        gamma = pdf_d1 / (S * sigma * np.sqrt(T))
-        vega = S * pdf_d1 * np.sqrt(T) / 100
-        theta = (-S * pdf_d1 * sigma / (2 * np.sqrt(T)) 
-                 + r * K * np.exp(-r * T) * norm.cdf(-d2)) / 365
-        rho = -K * T * np.exp(-r * T) * norm.cdf(-d2) / 100
+        greeks = {name: value[()] for name, value in
+                  price_batch(S, K, T, r, sigma, option_type.lower()).items()}
     
     return {
-        'delta': delta,
-        'gamma': gamma,
-        'theta': theta,
-        'vega': vega,
-        'rho': rho
+        'delta': greeks['delta'],
+        'gamma': greeks['gamma'],
+        'theta': greeks['theta'] / 365,
+        'vega': greeks['vega'] / 100,
+        'rho': greeks['rho'] / 100
     }
 
 def calculate_ml_risk_score(S: float, K: float, T: float, vol: float, 
@@ -1156,6 +1149,8 @@ def main_application():
     option_type = st.sidebar.radio("Option Type", ["Call", "Put"], 
                                    index=0 if default_option_type == 'Call' else 1)
     
+    exercise_style = st.sidebar.radio("Exercise Style", ["European", "American"])
+    
     expiry_days = st.sidebar.slider("Time to Expiry (days)", 7, 365, default_expiry_days)
     
     history_years = st.sidebar.slider("Stock History (years)", 1, 10, default_history_years)
@@ -1272,9 +1267,9 @@ def main_application():
     # OPTION PRICING
     # =============================
     if option_type == "Call":
-        bs_price = call_price(S, K, T, RISK_FREE_RATE, vol)
+        bs_price = call_price(S, K, T, RISK_FREE_RATE, vol, exercise=exercise_style.lower())
     else:
-        bs_price = put_price(S, K, T, RISK_FREE_RATE, vol)
+        bs_price = put_price(S, K, T, RISK_FREE_RATE, vol, exercise=exercise_style.lower())
     
     delta, theta, vega = calculate_greeks(S, K, T, RISK_FREE_RATE, vol)
     hedge = delta_hedge(delta)
@@ -1287,8 +1282,9 @@ def main_application():
     
     if pricing_mode == "ML-Adjusted":
         with st.spinner("Training global ML adjustment..."):
-            df = generate_option_samples(S, K, RISK_FREE_RATE, hist_vol, n=1500)
-            model, scaler, mae = train_model(df)
+            # seeded so identical inputs hash to the same registry entry across reruns
+            df = generate_option_samples(S, K, RISK_FREE_RATE, hist_vol, n=1500, seed=RANDOM_STATE)
+            model, scaler, mae = get_model_registry().get_or_train(train_model, df)
             features = scaler.transform([[S, K, T, vol, delta, theta, vega]])
             ml_price = model.predict(features)[0]
     
@@ -1335,7 +1331,7 @@ def main_application():
     # TAB 1 — PRICING & RISK (UPDATED WITH RISK METER)
     # =============================
     with tab1:
-        st.subheader(f"{ticker} — {option_type} Option")
+        st.subheader(f"{ticker} — {exercise_style} {option_type} Option")
         
         # Display risk score at the top if enabled
         if enable_risk_meter:
@@ -1406,6 +1402,13 @@ def main_application():
         st.write(f"Historical Volatility: **{hist_vol:.2%}**")
         st.write(f"Scenario Volatility: **{vol:.2%}**")
     
+        vol_history = get_volatility_history(data["returns"])
+        st.write(
+            f"EWMA (λ=0.94): **{vol_history['EWMA'].iloc[-1]:.2%}** · "
+            f"GARCH(1,1): **{vol_history['GARCH(1,1)'].iloc[-1]:.2%}**"
+        )
+        st.line_chart(vol_history)
+    
         if use_real_chain:
             with st.spinner("Loading option chain..."):
                 chain = load_option_chain(ticker)
@@ -1413,10 +1416,26 @@ def main_application():
             st.success("Real Yahoo option chain loaded")
     
             if show_surface:
-                surface = approximate_vol_surface(chain)
+                surface = approximate_vol_surface(chain, S)
                 st.write("Approximate Volatility Surface (Smile by Expiry)")
                 st.dataframe(surface)
     
+                try:
+                    svi = svi_surface(chain, S, RISK_FREE_RATE)
+                except ValueError as e:
+                    st.warning(f"Could not fit SVI surface: {e}")
+                else:
+                    st.write("SVI Surface Fit (per expiry)")
+                    st.dataframe(svi.params_frame())
+    
+                    moneyness = np.linspace(0.8, 1.2, 9)
+                    grid = pd.DataFrame(
+                        svi.iv(S * moneyness[None, :], svi.T[:, None]),
+                        index=svi.expiries, columns=[f"{m:.2f}" for m in moneyness]
+                    )
+                    st.write("SVI Implied Vol by Strike / Spot")
+                    st.dataframe(grid.style.format("{:.2%}"))
+    
     # =============================
     # TAB 4 — MARKET DATA
     # =============================
@@ -1614,12 +1633,21 @@ def main_application():
                     "Combined Stress": {"S_mult": 0.8, "vol_mult": 1.5, "T_days": 7}
                 }
                 
+                # Second-order Greeks for P&L estimates without repricing
+                base_greeks = price_batch(
+                    S, K, T, RISK_FREE_RATE, vol, option_type.lower(), second_order=True
+                )
+                
                 for scenario_name, params in scenarios.items():
                     # Calculate stress Greeks
                     S_stress = S * params.get('S_mult', 1.0)
                     vol_stress = vol * params.get('vol_mult', 1.0)
                     T_stress = params.get('T_days', expiry_days) / 365
                     
+                    est_pnl = second_order_pnl(
+                        base_greeks, S_stress - S, vol_stress - vol, T - T_stress
+                    )[()]
+                    
                     stress_greeks = calculate_all_greeks(
                         S_stress, K, T_stress, RISK_FREE_RATE, vol_stress, option_type
                     )
@@ -1629,7 +1657,7 @@ def main_application():
                         S_stress, K, T_stress, vol_stress, stress_greeks, option_type, chain_data
                     )
                     
-                    col_scen1, col_scen2, col_scen3 = st.columns([2, 1, 1])
+                    col_scen1, col_scen2, col_scen3, col_scen4 = st.columns([2, 1, 1, 1])
                     with col_scen1:
                         st.write(f"**{scenario_name}**")
                     with col_scen2:
@@ -1637,6 +1665,8 @@ def main_application():
                     with col_scen3:
                         delta_score = stress_score - adjusted_score
                         st.write(f"Δ: {delta_score:+.1f}")
+                    with col_scen4:
+                        st.write(f"Est. P&L: ${est_pnl:+.2f}")
             
             # Export functionality
             st.markdown("---")
@@ -0,0 +1,71 @@
+"""
+Sequential vs bulk_fetch over a stub provider: the data/raw price files
+served with simulated network latency and transient failures.
+
+Run from the repo root: python -m benchmarks.bench_bulk_fetch
+"""
+import random
+import threading
+import time
+
+from src.bulk_fetch import bulk_fetch
+from src.config import TICKERS
+from src.price_cache import CsvSource
+
+
+class FlakySource(CsvSource):
+    """CsvSource with per-ticker latency, a transient first-call failure for some tickers and one dead ticker."""
+
+    def __init__(self, latency, flaky=(), dead=()):
+        super().__init__()
+        self.latency = latency
+        self.flaky = set(flaky)
+        self.dead = set(dead)
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def history(self, ticker, start=None):
+        with self._lock:
+            self.calls[ticker] = self.calls.get(ticker, 0) + 1
+            first = self.calls[ticker] == 1
+
+        time.sleep(self.latency.get(ticker, 0.2))
+        if ticker in self.dead or (ticker in self.flaky and first):
+            raise ConnectionError(f"stub failure for {ticker}")
+        return super().history(ticker, start)
+
+
+def main(seed=7):
+    rng = random.Random(seed)
+    universe = TICKERS + ["DEAD"]
+    latency = {t: rng.uniform(0.2, 0.6) for t in universe}
+    slowest = max(latency.values())
+
+    source = FlakySource(latency)
+    start = time.perf_counter()
+    for ticker in TICKERS:
+        source.history(ticker)
+    sequential = time.perf_counter() - start
+
+    source = FlakySource(latency)
+    start = time.perf_counter()
+    bulk_fetch(TICKERS, source.history, max_workers=8, rate=20.0)
+    clean = time.perf_counter() - start
+
+    # failing tickers cost their own retries (the dead one 3 x latency) but nothing more
+    source = FlakySource(latency, flaky=TICKERS[:2], dead=["DEAD"])
+    start = time.perf_counter()
+    results, errors = bulk_fetch(universe, source.history, max_workers=8, rate=20.0, retries=2, backoff=0.05)
+    bulk = time.perf_counter() - start
+
+    print(f"{len(TICKERS)} tickers, slowest single fetch {slowest:.2f}s")
+    print(f"  sequential (no failures):     {sequential:.2f}s")
+    print(f"  bulk_fetch (no failures):     {clean:.2f}s")
+    print(f"  bulk_fetch (2 flaky, 1 dead): {bulk:.2f}s")
+    print(f"  fetched {sorted(results)}")
+    print(f"  errors  {({t: str(e) for t, e in errors.items()})}")
+    print(f"  calls   {source.calls}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Memory of a full multi-ticker chain as a load_option_chain DataFrame vs
+CompactChain, plus slice and decode costs. The chain is synthetic but
+has yfinance's columns and dtypes, including OCC contract symbols.
+
+Run from the repo root:
+    python -m benchmarks.bench_compact_chain [expiries] [strikes]
+"""
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.compact_chain import CompactChain
+from src.config import TICKERS
+
+
+def synthetic_chain(n_expiries=20, n_strikes=120, seed=7):
+    rng = np.random.default_rng(seed)
+    expiries = pd.date_range("2026-10-23", periods=n_expiries, freq="7D")
+    frames = []
+
+    for ticker in TICKERS:
+        spot = rng.uniform(80, 600)
+        strikes = np.round(np.linspace(0.5, 1.5, n_strikes) * spot * 2) / 2
+        for expiry in expiries:
+            for opt_type in ("call", "put"):
+                n = n_strikes
+                frames.append(pd.DataFrame({
+                    "contractSymbol": [f"{ticker}{expiry:%y%m%d}{opt_type[0].upper()}{int(k * 1000):08d}"
+                                       for k in strikes],
+                    "lastTradeDate": pd.Timestamp("2026-10-16 19:59", tz="UTC")
+                                     - pd.to_timedelta(rng.integers(0, 86400, n), unit="s"),
+                    "strike": strikes,
+                    "lastPrice": rng.uniform(0.01, 100, n),
+                    "bid": rng.uniform(0.01, 100, n),
+                    "ask": rng.uniform(0.01, 100, n),
+                    "change": rng.normal(0, 1, n),
+                    "percentChange": rng.normal(0, 5, n),
+                    "volume": np.where(rng.random(n) < 0.3, np.nan, rng.integers(0, 5000, n)),
+                    "openInterest": rng.integers(0, 50000, n).astype(float),
+                    "impliedVolatility": rng.uniform(0.1, 1.2, n),
+                    "inTheMoney": rng.random(n) < 0.5,
+                    "contractSize": "REGULAR",
+                    "currency": "USD",
+                    "option_type": opt_type,
+                    "expiry": f"{expiry:%Y-%m-%d}",
+                    "ticker": ticker,
+                }))
+
+    return pd.concat(frames, ignore_index=True)
+
+
+def main(n_expiries=20, n_strikes=120):
+    df = synthetic_chain(n_expiries, n_strikes)
+    frame_bytes = df.memory_usage(deep=True, index=False)
+
+    start = time.perf_counter()
+    chain = CompactChain.from_frame(df)
+    build_s = time.perf_counter() - start
+    compact_bytes = chain.memory_usage()
+
+    print(f"{len(TICKERS)} tickers x {n_expiries} expiries x {n_strikes} strikes x 2 = {len(df):,} contracts")
+    print(f"  {'column':<18}{'DataFrame KB':>14}{'compact KB':>12}")
+    for name in df.columns:
+        print(f"  {name:<18}{frame_bytes[name] / 1e3:>14.1f}{compact_bytes.get(name, 0) / 1e3:>12.1f}")
+    total = frame_bytes.sum()
+    print(f"  {'total':<18}{total / 1e6:>11.2f} MB{compact_bytes['total'] / 1e6:>9.2f} MB"
+          f"  ({total / compact_bytes['total']:.1f}x smaller)")
+    print(f"  contract symbols rebuilt from the key columns: {chain.symbols is None}")
+
+    exact = CompactChain.from_frame(df, exact=True)
+    pd.testing.assert_frame_equal(exact.to_frame(), df)
+    print(f"  exact=True (float64, input row order; what ChainCache holds): "
+          f"{exact.memory_usage()['total'] / 1e6:.2f} MB, decodes to the identical frame")
+
+    expiry = chain.expiries[len(chain.expiries) // 2]
+    start = time.perf_counter()
+    for _ in range(1000):
+        part = chain.slice(expiry, "AAPL")
+    slice_us = (time.perf_counter() - start) / 1000 * 1e6
+
+    mask_s = time.perf_counter()
+    for _ in range(100):
+        df[(df["expiry"] == f"{pd.Timestamp(expiry):%Y-%m-%d}") & (df["ticker"] == "AAPL")]
+    mask_us = (time.perf_counter() - mask_s) / 100 * 1e6
+
+    start = time.perf_counter()
+    back = chain.to_frame()
+    decode_s = time.perf_counter() - start
+
+    merged = df.merge(back, on="contractSymbol", suffixes=("", "_c"))
+    iv_err = np.max(np.abs(merged["impliedVolatility"] - merged["impliedVolatility_c"]) / merged["impliedVolatility"])
+    print(f"\n  from_frame {build_s * 1e3:.1f} ms, to_frame {decode_s * 1e3:.1f} ms, "
+          f"round trip rows {len(merged):,}, max IV rel err {iv_err:.1e}")
+    print(f"  one expiry of one ticker: slice {slice_us:.1f} us ({len(part)} rows, views) "
+          f"vs boolean mask {mask_us:.0f} us")
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:3]))
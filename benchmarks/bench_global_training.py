@@ -0,0 +1,60 @@
+"""
+Training engines for src.global_ml_model.train_global_model: wall time,
+peak traced memory and held-out MAE on data/processed/options_dataset.csv
+and on a synthetic multi-ticker set (1M rows by default).
+
+Run from the repo root:
+    python -m benchmarks.bench_global_training [synthetic_rows]
+"""
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from src.config import RANDOM_STATE, RISK_FREE_RATE, TICKERS
+from src.feature_engineering import generate_option_samples
+from src.global_ml_model import ENGINES, train_global_model
+
+
+def synthetic_dataset(n_rows):
+    rng = np.random.default_rng(RANDOM_STATE)
+    per_ticker = -(-n_rows // len(TICKERS))
+    frames = []
+
+    for i, ticker in enumerate(TICKERS):
+        spot = rng.uniform(50, 500)
+        df = generate_option_samples(spot, round(spot), RISK_FREE_RATE, rng.uniform(0.2, 0.6),
+                                     n=per_ticker, seed=RANDOM_STATE + i)
+        df.insert(0, "Ticker", ticker)
+        frames.append(df)
+
+    return pd.concat(frames, ignore_index=True).iloc[:n_rows]
+
+
+def measure(df, engine):
+    tracemalloc.start()
+    start = time.perf_counter()
+    _, mae = train_global_model(df, engine=engine)
+    wall = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return wall, peak, mae
+
+
+def main(synthetic_rows=1_000_000):
+    datasets = {
+        "options_dataset.csv": pd.read_csv("data/processed/options_dataset.csv"),
+        f"synthetic {synthetic_rows:,}": synthetic_dataset(synthetic_rows),
+    }
+
+    print(f"{'dataset':<22} {'engine':<6} {'wall s':>8} {'peak MB':>8} {'val MAE':>8}")
+    for name, df in datasets.items():
+        for engine in ENGINES:
+            wall, peak, mae = measure(df, engine)
+            print(f"{name:<22} {engine:<6} {wall:>8.2f} {peak / 2**20:>8.1f} {mae:>8.4f}")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,67 @@
+"""
+Leisen-Reimer lattice checks: theta against a finite difference of
+lattice prices in T, American calls (no dividends) against Black-Scholes,
+and pricing time for a chain larger than one workspace chunk.
+
+Run from the repo root: python -m benchmarks.bench_lattice
+"""
+import time
+
+import numpy as np
+
+from src.batch_pricing import price_batch
+from src.lattice import LATTICE_CHUNK, american_price_batch
+
+
+def check_theta(n=200, seed=3, h=1e-3):
+    rng = np.random.default_rng(seed)
+    S, K = rng.uniform(50, 150, n), rng.uniform(50, 150, n)
+    T, r, sigma = rng.uniform(0.1, 2.0, n), rng.uniform(0.0, 0.08, n), rng.uniform(0.1, 0.8, n)
+    worst = 0.0
+
+    for option_type in ("call", "put"):
+        theta = american_price_batch(S, K, T, r, sigma, option_type)["theta"]
+        up = american_price_batch(S, K, T + h, r, sigma, option_type, greeks=False)["price"]
+        down = american_price_batch(S, K, T - h, r, sigma, option_type, greeks=False)["price"]
+        fd = (down - up) / (2 * h)
+
+        error = np.abs(theta - fd) / np.maximum(np.abs(fd), 1.0)
+        assert error.max() < 0.05, (option_type, error.max())
+        worst = max(worst, error.max())
+
+    # the case from review: S=100, K=110, T=0.5, r=5%, sigma=30%
+    put = american_price_batch(100.0, 110.0, 0.5, 0.05, 0.3, "put")["theta"]
+    call = american_price_batch(100.0, 110.0, 0.5, 0.05, 0.3, "call")["theta"]
+    bs_call = price_batch(100.0, 110.0, 0.5, 0.05, 0.3, "call")["theta"]
+    assert abs(call - bs_call) < 0.05, (call, bs_call)
+
+    print(f"theta vs finite difference: worst relative error {worst:.2e} over {2 * n} contracts")
+    print(f"  S=100 K=110 T=0.5: put {float(put):.3f}, call {float(call):.3f} (Black-Scholes {float(bs_call):.3f})")
+
+
+def check_calls(n=2000, seed=5):
+    rng = np.random.default_rng(seed)
+    args = (rng.uniform(50, 150, n), rng.uniform(50, 150, n), rng.uniform(0.05, 2.0, n),
+            rng.uniform(0.005, 0.08, n), rng.uniform(0.1, 0.8, n))
+
+    tree = american_price_batch(*args, "call")
+    bs = price_batch(*args, "call")
+    for name in ("price", "delta", "theta", "vega", "rho"):
+        print(f"  call {name:5s}: max |lattice - Black-Scholes| {np.max(np.abs(tree[name] - bs[name])):.2e}")
+
+
+def main():
+    check_theta()
+    print("American calls without dividends vs Black-Scholes")
+    check_calls()
+
+    n = 5 * LATTICE_CHUNK + 17
+    rng = np.random.default_rng(0)
+    args = (100.0, rng.uniform(60, 140, n), rng.uniform(0.05, 2.0, n), 0.04, rng.uniform(0.1, 0.8, n))
+    start = time.perf_counter()
+    american_price_batch(*args, "put")
+    print(f"{n:,} American puts with Greeks: {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    main()
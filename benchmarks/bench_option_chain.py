@@ -0,0 +1,123 @@
+"""
+Serial vs concurrent expiry download, and the TTL cache under concurrent
+callers, against a stub with the yfinance Ticker interface.
+
+Run from the repo root: python -m benchmarks.bench_option_chain
+"""
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.option_chain import ChainCache, fetch_option_chain
+
+Chain = namedtuple("Chain", ["calls", "puts"])
+
+
+class StubTicker:
+    """Fake yfinance Ticker: 20 expiries, ~0.1s per option_chain call."""
+
+    def __init__(self, n_expiries=20, strikes=80, latency=0.1):
+        self.options = [d.strftime("%Y-%m-%d") for d in pd.date_range("2026-11-20", periods=n_expiries, freq="7D")]
+        self.strikes = strikes
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def option_chain(self, expiry):
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+
+        rng = np.random.default_rng(abs(hash(expiry)) % 2**32)
+        def side():
+            return pd.DataFrame({
+                "contractSymbol": [f"STUB{expiry}{k}" for k in range(self.strikes)],
+                "strike": np.linspace(100, 300, self.strikes),
+                "lastPrice": rng.uniform(0.5, 40, self.strikes),
+                "bid": rng.uniform(0.5, 40, self.strikes),
+                "ask": rng.uniform(0.5, 40, self.strikes),
+                "impliedVolatility": rng.uniform(0.2, 0.6, self.strikes),
+            })
+        return Chain(side(), side())
+
+
+def serial_load(ticker, stock):
+    # the previous implementation: one expiry at a time, copy + tag each frame
+    frames = []
+    for expiry in stock.options:
+        chain = stock.option_chain(expiry)
+        for opt_type, df in zip(["call", "put"], [chain.calls, chain.puts]):
+            df = df.copy()
+            df["option_type"] = opt_type
+            df["expiry"] = expiry
+            df["ticker"] = ticker
+            frames.append(df)
+    return pd.concat(frames, ignore_index=True)
+
+
+def main():
+    stock = StubTicker()
+
+    start = time.perf_counter()
+    expected = serial_load("STUB", stock)
+    serial_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    got = fetch_option_chain("STUB", stock=stock)
+    concurrent_s = time.perf_counter() - start
+
+    pd.testing.assert_frame_equal(expected, got)
+    print(f"{len(stock.options)} expiries, {len(got):,} contracts")
+    print(f"  serial:     {serial_s:.2f}s")
+    print(f"  concurrent: {concurrent_s:.2f}s  (identical frame)")
+
+    stock = StubTicker()
+    cache = ChainCache(lambda ticker: fetch_option_chain(ticker, stock=stock), ttl_seconds=60)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        frames = list(pool.map(cache.get, ["STUB"] * 8))
+    shared_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hit = cache.get("STUB")
+    hit_s = time.perf_counter() - start
+    # the compact snapshot decodes to exactly what was fetched
+    pd.testing.assert_frame_equal(hit, got)
+
+    print("\n8 concurrent callers, cold cache")
+    print(f"  wall {shared_s:.2f}s, option_chain calls {stock.calls} (one download)")
+    print(f"  warm hit: {hit_s * 1e3:.2f} ms (identical frame), snapshot {frames[0].attrs['snapshot_time']:%H:%M:%S}")
+
+    compact_vs_frame()
+
+
+def compact_vs_frame():
+    """What compact=True saves per cached ticker, and what each warm hit pays for it."""
+    from benchmarks.bench_compact_chain import synthetic_chain
+
+    chain = synthetic_chain()
+    chain = chain[chain["ticker"] == "AAPL"].reset_index(drop=True)
+    print(f"\none cached ticker, {len(chain):,} contracts with yfinance columns")
+
+    for compact in (False, True):
+        cache = ChainCache(lambda ticker: chain, ttl_seconds=60, compact=compact)
+        cache.get("AAPL")
+        stored = cache._snapshots["AAPL"][1]
+        held = stored.memory_usage()["total"] if compact else stored.memory_usage(deep=True).sum()
+
+        start = time.perf_counter()
+        for _ in range(50):
+            hit = cache.get("AAPL")
+        hit_ms = (time.perf_counter() - start) / 50 * 1e3
+
+        pd.testing.assert_frame_equal(hit, chain)
+        print(f"  compact={compact!s:<5}  held {held / 1e6:5.2f} MB   warm hit {hit_ms:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+PriceCache against a full recompute on the offline CsvSource: a cache
+filled up to some date and then refreshed must hold the same bars and
+returns as one built from the whole history, including when the source
+back-adjusts history for a split in between. Also times a cold load, a
+warm hit and a tail refresh.
+
+Run from the repo root: python -m benchmarks.bench_price_cache
+"""
+import os
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.price_cache import CsvSource, PriceCache
+
+TICKER = "AAPL"
+
+
+class ReplaySource(CsvSource):
+    """CsvSource as it looked on `today`, optionally with a split applied (and back-adjusted) on split_day."""
+
+    def __init__(self, today, split_day=None, ratio=10.0):
+        super().__init__()
+        self.today = today
+        self.split_day = split_day
+        self.ratio = ratio
+
+    def history(self, ticker, start=None):
+        bars = super().history(ticker)
+        bars.index = pd.DatetimeIndex(bars.index).tz_localize(None).normalize()
+        bars = bars[bars.index <= self.today].copy()
+
+        if self.split_day is not None and self.today >= self.split_day:
+            # prices trade 1/ratio from split_day on, and the source rescales
+            # every earlier bar to match
+            bars[["Open", "High", "Low", "Close"]] /= self.ratio
+            bars["Volume"] *= self.ratio
+            bars.loc[bars.index == self.split_day, "Stock Splits"] = self.ratio
+
+        return bars if start is None else bars[bars.index >= start]
+
+
+def refreshed(days, split_day=None):
+    """Cache built on days[0] and refreshed on each later day, vs a cold build on the last day."""
+    cache = PriceCache(ReplaySource(days[0], split_day), root=tempfile.mkdtemp(), ttl_seconds=0)
+    cache.refresh(TICKER)
+    for day in days[1:]:
+        cache.source = ReplaySource(day, split_day)
+        warm = cache.refresh(TICKER)
+
+    cold = PriceCache(ReplaySource(days[-1], split_day), root=tempfile.mkdtemp()).refresh(TICKER)
+    pd.testing.assert_frame_equal(warm, cold, check_freq=False)
+    return warm
+
+
+def main():
+    dates = pd.DatetimeIndex(CsvSource().history(TICKER).index).tz_localize(None).normalize()
+    days = list(dates[-30:])
+
+    data = refreshed(days)
+    print(f"{len(data)} bars, 29 daily tail refreshes: identical to a full recompute")
+
+    split_day = days[15]
+    data = refreshed(days, split_day)
+    worst = np.abs(data["returns"].dropna()).max()
+    assert worst < 0.5, worst
+    print(f"10:1 split on {split_day:%Y-%m-%d}, back-adjusted by the source: identical to a full "
+          f"recompute, largest |log return| {worst:.3f}")
+
+    root = tempfile.mkdtemp()
+    cache = PriceCache(ReplaySource(days[-2]), root=root, ttl_seconds=3600)
+    start = time.perf_counter()
+    cache.load(TICKER)
+    cold_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cache.load(TICKER)
+    hit_s = time.perf_counter() - start
+
+    cache.source, cache.ttl_seconds = ReplaySource(days[-1]), 0
+    start = time.perf_counter()
+    cache.load(TICKER)
+    tail_s = time.perf_counter() - start
+
+    print(f"cold load {cold_s * 1e3:.1f} ms, warm hit {hit_s * 1e3:.1f} ms, tail refresh {tail_s * 1e3:.1f} ms "
+          f"({os.listdir(root)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Training-set design: i.i.d. uniform vs scrambled Sobol (optionally
+stratified around a query maturity) samples for src.ml_model.train_model.
+Reports the MAE of the fitted model against exact Black-Scholes prices on
+a fixed uniform test set, on its ATM rows near the query maturity, and
+the training time, for growing sample counts.
+
+Run from the repo root: python -m benchmarks.bench_sampling_design
+"""
+import time
+
+import numpy as np
+
+from src.black_scholes import call_price
+from src.config import RANDOM_STATE, RISK_FREE_RATE
+from src.feature_engineering import generate_option_samples
+from src.ml_model import train_model
+
+S, K, BASE_VOL = 250.0, 250.0, 0.3
+QUERY_T = 0.25
+SAMPLE_COUNTS = (256, 512, 1024, 2048, 4096)
+DESIGNS = {
+    "uniform": dict(sampling="uniform"),
+    "sobol": dict(sampling="sobol"),
+    "sobol+strat": dict(sampling="sobol", stratify=True, T=QUERY_T),
+}
+
+
+def main():
+    test = generate_option_samples(S, K, RISK_FREE_RATE, BASE_VOL, n=20000, seed=RANDOM_STATE + 1)
+    exact = call_price(test["Spot"].to_numpy(), test["Strike"].to_numpy(), test["T"].to_numpy(),
+                       RISK_FREE_RATE, test["Vol"].to_numpy())
+    X_test = test.drop("MarketPrice", axis=1)
+    atm = ((test["Strike"] / test["Spot"] - 1).abs() < 0.03).to_numpy() & \
+        ((test["T"] - QUERY_T).abs() < 0.05).to_numpy()
+
+    print(f"{'design':<12} {'rows':>6} {'MAE':>8} {'ATM MAE':>8} {'train s':>8}")
+    for name, design in DESIGNS.items():
+        for n in SAMPLE_COUNTS:
+            df = generate_option_samples(S, K, RISK_FREE_RATE, BASE_VOL, n=n, seed=RANDOM_STATE, **design)
+
+            start = time.perf_counter()
+            model, scaler, _ = train_model(df)
+            train_s = time.perf_counter() - start
+
+            errors = np.abs(model.predict(scaler.transform(X_test)) - exact)
+            print(f"{name:<12} {n:>6} {errors.mean():>8.4f} {errors[atm].mean():>8.4f} {train_s:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+"""
+Scalar fast path vs array path for single-contract pricing. Parity is
+checked in tests/test_scalar_pricing.py.
+
+Run from the repo root: python -m benchmarks.bench_scalar_pricing
+"""
+import time
+
+from src.batch_pricing import price_batch
+from src.scalar_pricing import price_scalar
+
+
+def time_call(fn, repeat=20000):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main():
+    args = (187.3, 185.0, 30 / 365, 0.05, 0.27)
+    scalar_us = time_call(lambda: price_scalar(*args, "call"))
+    array_us = time_call(lambda: price_batch(*args, "call"))
+
+    print(f"Scalar path: {scalar_us:.2f} us/contract")
+    print(f"Array path:  {array_us:.2f} us/contract")
+    print(f"Speedup:     {array_us / scalar_us:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
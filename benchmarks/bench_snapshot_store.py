@@ -0,0 +1,72 @@
+"""
+One simulated trading day of 5-minute chain snapshots: disk used by the
+delta-encoded store vs a full Parquet frame per snapshot, point-in-time
+read latency and range-scan throughput.
+
+Run from the repo root:
+    python -m benchmarks.bench_snapshot_store [changed_fraction]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.bench_compact_chain import synthetic_chain
+from src.snapshot_store import ChainSnapshotStore
+
+
+def disk_bytes(root):
+    return sum(os.path.getsize(os.path.join(d, f)) for d, _, files in os.walk(root) for f in files)
+
+
+def main(changed_fraction=0.08, n_snapshots=78, seed=7):
+    rng = np.random.default_rng(seed)
+    chain = synthetic_chain(20, 120)
+    chain = chain[chain["ticker"] == "AAPL"].reset_index(drop=True)
+    times = pd.date_range("2026-10-16 09:30", periods=n_snapshots, freq="5min")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = ChainSnapshotStore(os.path.join(tmp, "store"))
+        full_dir = os.path.join(tmp, "full")
+        os.makedirs(full_dir)
+
+        snapshots, append_s = [], 0.0
+        for when in times:
+            moved = rng.random(len(chain)) < changed_fraction
+            chain = chain.copy()
+            chain.loc[moved, ["bid", "ask", "lastPrice"]] *= rng.uniform(0.97, 1.03, (moved.sum(), 1))
+            chain.loc[moved, "volume"] = chain.loc[moved, "volume"].fillna(0) + rng.integers(1, 50, moved.sum())
+            snapshots.append(chain)
+
+            chain.to_parquet(os.path.join(full_dir, f"{when:%H%M}.parquet"), index=False)
+            start = time.perf_counter()
+            store.append(chain, when)
+            append_s += time.perf_counter() - start
+
+        full, delta = disk_bytes(full_dir), disk_bytes(store.root)
+        print(f"{n_snapshots} snapshots of {len(chain):,} contracts, {changed_fraction:.0%} changing per snapshot")
+        print(f"  full frames: {full / 1e6:6.2f} MB")
+        print(f"  delta store: {delta / 1e6:6.2f} MB  ({full / delta:.1f}x smaller), "
+              f"append {append_s / n_snapshots * 1e3:.1f} ms/snapshot")
+
+        reader = ChainSnapshotStore(store.root)
+        worst = times[store.base_every - 1]  # most deltas to replay after a base
+        start = time.perf_counter()
+        got = reader.as_of("AAPL", worst)
+        as_of_s = time.perf_counter() - start
+
+        expected = snapshots[store.base_every - 1].set_index("contractSymbol").sort_index()
+        pd.testing.assert_frame_equal(got, expected)
+        print(f"  as_of (base + {store.base_every - 1} deltas): {as_of_s * 1e3:.1f} ms, identical to the original")
+
+        start = time.perf_counter()
+        n = sum(1 for _ in reader.scan("AAPL", times[0], times[-1]))
+        scan_s = time.perf_counter() - start
+        print(f"  scan of the whole day: {n} snapshots in {scan_s:.2f}s ({scan_s / n * 1e3:.1f} ms each)")
+
+
+if __name__ == "__main__":
+    main(*map(float, sys.argv[1:2]))
@@ -0,0 +1,59 @@
+"""
+Load time and on-disk size of CSV vs the src.storage formats, for a
+price history file and a synthetic options dataset.
+
+Run from the repo root:
+    python -m benchmarks.bench_storage [synthetic_rows]
+"""
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.feature_engineering import generate_option_samples
+from src.storage import FORMATS, _size, load_frame, save_frame
+
+
+def timed(fn, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def compare(name, csv_path, tmp):
+    csv_s, df = timed(lambda: load_frame(csv_path))
+    raw = pd.read_csv(csv_path).select_dtypes("number")
+    print(f"\n{name}: {len(df):,} rows")
+    print(f"  {'format':<9}{'size MB':>9}{'load ms':>10}{'one col ms':>12}{'max rel err':>13}")
+    print(f"  {'csv':<9}{os.path.getsize(csv_path) / 1e6:>9.2f}{csv_s * 1e3:>10.1f}{'':>12}{'':>13}")
+
+    column = df.columns[-1]
+    for ext, fmt in FORMATS.items():
+        path = os.path.join(tmp, os.path.basename(csv_path)[:-4] + ext)
+        save_frame(df, path)
+
+        load_s, loaded = timed(lambda: load_frame(path))
+        col_s, _ = timed(lambda: np.asarray(load_frame(path, columns=[column])[column]).sum())
+        # float32 columns vs the 17-digit CSV text
+        err = max(np.nanmax(np.abs(loaded[c].to_numpy(np.float64) / raw[c].to_numpy() - 1)) for c in raw.columns
+                  if (raw[c] != 0).all())
+        print(f"  {fmt:<9}{_size(path) / 1e6:>9.2f}{load_s * 1e3:>10.1f}{col_s * 1e3:>12.1f}{err:>13.1e}")
+
+
+def main(n_rows=1_000_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        compare("AAPL price history", "data/raw/aapl_price.csv", tmp)
+
+        csv_path = os.path.join(tmp, "synthetic_options_dataset.csv")
+        generate_option_samples(190.0, 185.0, 0.05, 0.27, n=n_rows, seed=7).to_csv(csv_path, index=False)
+        compare("Synthetic options dataset", csv_path, tmp)
+
+
+if __name__ == "__main__":
+    main(*map(int, sys.argv[1:2]))
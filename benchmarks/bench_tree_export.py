@@ -0,0 +1,64 @@
+"""
+Flattened tree ensemble vs the pickled sklearn forest from train_model.
+
+Run from the repo root: python -m benchmarks.bench_tree_export
+"""
+import os
+import pickle
+import tempfile
+import time
+
+import numpy as np
+
+from src.feature_engineering import generate_option_samples
+from src.ml_model import train_model
+from src.tree_export import FlatEnsemble
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main(n=2000, seed=7):
+    df = generate_option_samples(190.0, 185.0, 0.05, 0.27, n=n, seed=seed)
+    model, scaler, _ = train_model(df)
+    X = scaler.transform(df.drop("MarketPrice", axis=1))
+
+    flat = FlatEnsemble.from_sklearn(model)
+    with tempfile.TemporaryDirectory() as tmp:
+        pickled = os.path.join(tmp, "model.pkl")
+        with open(pickled, "wb") as f:
+            pickle.dump(model, f)
+        flat.save(os.path.join(tmp, "flat"))
+
+        def unpickle():
+            with open(pickled, "rb") as f:
+                return pickle.load(f)
+
+        unpickle_s, _ = timed(unpickle, repeat=3)
+        load_s, flat = timed(lambda: FlatEnsemble.load(os.path.join(tmp, "flat")), repeat=3)
+
+        print(f"{len(model.estimators_)} trees, {len(flat.arrays['value']):,} nodes, depth {flat.depth}")
+        print(f"  unpickle sklearn: {unpickle_s * 1e3:8.1f} ms")
+        print(f"  mmap load flat:   {load_s * 1e3:8.1f} ms")
+
+        batch_sk_s, expected = timed(lambda: model.predict(X))
+        batch_flat_s, got = timed(lambda: flat.predict(X))
+        print(f"\nBatch of {len(X):,} rows")
+        print(f"  sklearn: {batch_sk_s * 1e3:8.1f} ms")
+        print(f"  flat:    {batch_flat_s * 1e3:8.1f} ms")
+        print(f"  max |difference|: {np.max(np.abs(expected - got)):.2e}")
+
+        row = X[:1]
+        one_sk_s, _ = timed(lambda: model.predict(row), repeat=50)
+        one_flat_s, _ = timed(lambda: flat.predict(row), repeat=500)
+        print("\nSingle row")
+        print(f"  sklearn: {one_sk_s * 1e3:8.2f} ms")
+        print(f"  flat:    {one_flat_s * 1e3:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Successive-halving search over the processed datasets, printing the
+accuracy/latency leaderboard and the cheapest model within budget.
+
+Run from the repo root:
+    python -m benchmarks.bench_tuning [model] [max_mae]
+"""
+import glob
+import os
+import sys
+import time
+
+import pandas as pd
+
+from src.tuning import cheapest_within, successive_halving
+
+
+def processed_datasets(pattern="data/processed/*_options_dataset.csv"):
+    frames = []
+    for path in sorted(glob.glob(pattern)):
+        df = pd.read_csv(path)
+        df.insert(0, "Ticker", os.path.basename(path).split("_")[0].upper())
+        frames.append(df)
+
+    # the CSVs carry no timestamps; treat each file's row order as time so
+    # every fold block holds all tickers
+    df = pd.concat(frames, ignore_index=True)
+    df["Snapshot"] = df.groupby("Ticker").cumcount()
+    return df
+
+
+def main(model="rf", max_mae=1.0):
+    df = processed_datasets()
+    print(f"{len(df):,} rows from {df['Ticker'].nunique()} tickers")
+
+    start = time.perf_counter()
+    leaderboard = successive_halving(df, model=model)
+    print(f"Search took {time.perf_counter() - start:.1f}s\n")
+
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print(leaderboard.round(4).to_string(index=False))
+
+    best = cheapest_within(leaderboard, max_mae)
+    print(f"\nCheapest within MAE {max_mae}:")
+    print("  none" if best is None else best.to_string())
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2], *map(float, sys.argv[2:3]))
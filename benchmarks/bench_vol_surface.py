@@ -0,0 +1,128 @@
+"""
+SVI surface engine on a synthetic chain drawn from a known SVI surface
+with 0.2% IV noise: fit time, recovery error and query latency, next to
+the binned approximate_vol_surface table, then incremental refits after
+quote updates touching a few expiries (warm-started, dirty slices only)
+against refitting everything.
+
+Run from the repo root: python -m benchmarks.bench_vol_surface
+"""
+import time
+
+import numpy as np
+import pandas as pd
+
+from src.vol_surface import SurfaceCache, SVISurface, approximate_vol_surface, svi_surface, svi_total_variance
+
+SPOT, RATE = 200.0, 0.05
+AS_OF = pd.Timestamp("2026-10-17")
+
+
+def true_params(T):
+    return np.array([0.04 * T, 0.1 * np.sqrt(T) + 0.02, -0.5, 0.02, 0.15 * np.sqrt(T) + 0.02])
+
+
+def synthetic_chain(seed=7):
+    rng = np.random.default_rng(seed)
+    strikes = np.arange(100, 301, 2.5)
+    frames = []
+
+    for expiry in pd.date_range("2026-10-18", "2028-12-31", freq="WOM-3FRI"):
+        T = (expiry - AS_OF).days / 365
+        k = np.log(strikes / (SPOT * np.exp(RATE * T)))
+        iv = np.sqrt(svi_total_variance(true_params(T), k) / T) * (1 + rng.normal(0, 0.002, len(strikes)))
+        for opt_type in ("call", "put"):
+            frames.append(pd.DataFrame({
+                "strike": strikes, "impliedVolatility": iv, "lastPrice": 1.0,
+                "expiry": f"{expiry:%Y-%m-%d}", "option_type": opt_type, "ticker": "TEST",
+            }))
+
+    chain = pd.concat(frames, ignore_index=True)
+    chain.attrs["snapshot_time"] = AS_OF
+    return chain
+
+
+def timed(fn, repeat=1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = fn()
+    return (time.perf_counter() - start) / repeat, result
+
+
+def main():
+    chain = synthetic_chain()
+
+    table_s, _ = timed(lambda: approximate_vol_surface(chain, SPOT))
+    fit_s, surface = timed(lambda: SVISurface.fit(chain, SPOT, RATE))
+    svi_surface(chain, SPOT, RATE)
+    hit_s, _ = timed(lambda: svi_surface(chain, SPOT, RATE), repeat=100)
+
+    K = np.linspace(140, 260, 200)
+    errors = [np.max(np.abs(surface.iv(K, T) - np.sqrt(svi_total_variance(true_params(T),
+              np.log(K / (SPOT * np.exp(RATE * T)))) / T))) for T in surface.T]
+
+    print(f"{len(chain):,} quotes, {len(surface.T)} expiries")
+    print(f"  approximate_vol_surface (5 bins): {table_s * 1e3:8.1f} ms")
+    print(f"  SVI fit, all slices:              {fit_s * 1e3:8.1f} ms  (cache hit {hit_s * 1e6:.0f} us)")
+    print(f"  max |IV error| vs true surface at fitted expiries (0.8-1.3 moneyness): {max(errors):.4f}")
+
+    rng = np.random.default_rng(0)
+    for n in (1, 1_000, 1_000_000):
+        K, T = rng.uniform(120, 280, n), rng.uniform(0.01, 2.0, n)
+        query_s, _ = timed(lambda: surface.iv(K, T), repeat=max(1, 1000 // n))
+        print(f"  iv() for {n:>9,} points: {query_s * 1e6:10.1f} us  ({query_s / n * 1e9:8.1f} ns/point)")
+
+    incremental(chain, surface)
+    check_rollover(chain)
+
+
+def incremental(chain, surface):
+    rng = np.random.default_rng(1)
+    expiries = np.unique(chain["expiry"])
+    print("\nquote updates (IV moves of up to 1% on 20 strikes per touched expiry)")
+
+    for touched in (1, 3, len(expiries)):
+        live = surface.copy()
+        update_s = []
+        for _ in range(20):
+            rows = chain[chain["expiry"].isin(rng.choice(expiries, touched, replace=False))]
+            rows = rows[rows["strike"].isin(rng.choice(rows["strike"].unique(), 20, replace=False))]
+            rows = rows.assign(impliedVolatility=rows["impliedVolatility"] * rng.uniform(0.99, 1.01, len(rows)))
+
+            start = time.perf_counter()
+            live.update_quotes(rows)
+            live.refit()
+            update_s.append(time.perf_counter() - start)
+
+        full_s, _ = timed(lambda: SVISurface.fit(pd.concat([chain, rows]), SPOT, RATE))
+        print(f"  {touched:>2} expiries touched: update + refit {np.median(update_s) * 1e3:7.1f} ms "
+              f"({live.refits['last']} slices refit), full fit {full_s * 1e3:7.1f} ms")
+
+    live = surface.copy()
+    start = time.perf_counter()
+    live.update_quotes(chain.iloc[:0], spot=SPOT * 1.002)
+    live.refit()
+    print(f"  spot move (all slices dirty, warm start): {(time.perf_counter() - start) * 1e3:7.1f} ms "
+          f"({live.refits['last']} slices refit)")
+
+
+def check_rollover(chain):
+    """A warm cache refit must match a cold fit of the same snapshot: expired or delisted quotes go."""
+    cache = SurfaceCache()
+    cache.get(chain, SPOT, RATE)
+
+    first = pd.Timestamp(min(chain["expiry"]))
+    later = chain[chain["strike"] != 100].copy()
+    later.attrs["snapshot_time"] = first + pd.Timedelta(days=1)
+
+    warm, cold = cache.get(later, SPOT, RATE), SVISurface.fit(later, SPOT, RATE)
+    assert list(warm.expiries) == list(cold.expiries), (warm.expiries[:2], cold.expiries[:2])
+    assert all(warm._quotes[e].index.equals(cold._quotes[e].index) for e in cold.expiries)
+
+    K, T = np.linspace(150, 250, 50)[:, None], cold.T[None, :]
+    print(f"\nnext-day snapshot: warm {len(warm.T)} slices, cold {len(cold.T)} slices, "
+          f"max |IV difference| {np.max(np.abs(warm.iv(K, T) - cold.iv(K, T))):.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 import os
 
-from src.config import TICKERS, RISK_FREE_RATE
+from src.config import (
+    TICKERS, RISK_FREE_RATE, STORAGE_FORMAT, FETCH_MAX_WORKERS, FETCH_RATE_PER_SECOND, FETCH_RETRIES
+)
+from src.bulk_fetch import bulk_fetch
 from src.data_loader import load_stock_data
 from src.volatility import historical_volatility
 from src.feature_engineering import generate_option_samples
@@ -8,21 +11,23 @@ from src.ml_model import train_model
 from src.black_scholes import call_price
 from src.greeks import calculate_greeks
 from src.hedge import delta_hedge
+from src.storage import save_frame
 
 
-def analyze_stock(ticker: str):
+def analyze_stock(ticker: str, data=None):
     print(f"\n================ {ticker} =================")
 
     # -------------------------------
     # 1. LOAD DATA
     # -------------------------------
-    data = load_stock_data(ticker)
+    if data is None:
+        data = load_stock_data(ticker)
 
     os.makedirs("data/raw", exist_ok=True)
     os.makedirs("data/processed", exist_ok=True)
 
-    raw_path = f"data/raw/{ticker.lower()}_price.csv"
-    data.to_csv(raw_path)
+    raw_path = f"data/raw/{ticker.lower()}_price{STORAGE_FORMAT}"
+    save_frame(data, raw_path)
 
     # -------------------------------
     # 2. MARKET PARAMETERS
@@ -47,8 +52,8 @@ def analyze_stock(ticker: str):
         n=1000
     )
 
-    processed_path = f"data/processed/{ticker.lower()}_options_dataset.csv"
-    df.to_csv(processed_path, index=False)
+    processed_path = f"data/processed/{ticker.lower()}_options_dataset{STORAGE_FORMAT}"
+    save_frame(df, processed_path)
 
     # -------------------------------
     # 4. ML TRAINING
@@ -81,9 +86,18 @@ def analyze_stock(ticker: str):
 
 
 def main():
+    # fetch every ticker's history concurrently, then analyze in order
+    histories, errors = bulk_fetch(
+        TICKERS, load_stock_data,
+        max_workers=FETCH_MAX_WORKERS, rate=FETCH_RATE_PER_SECOND, retries=FETCH_RETRIES
+    )
+
     for ticker in TICKERS:
+        if ticker in errors:
+            print(f"[ERROR] {ticker}: {errors[ticker]}")
+            continue
         try:
-            analyze_stock(ticker)
+            analyze_stock(ticker, histories[ticker])
         except Exception as e:
             print(f"[ERROR] {ticker}: {e}")
 
@@ -1,10 +1,40 @@
+import pandas as pd
 from fastapi import APIRouter
 from src.black_scholes import call_price
+from src.config import (
+    MODEL_REGISTRY_DIR, MODEL_REGISTRY_MAX_BYTES, ML_TRAINING_DATA, ML_MAX_BATCH_SIZE, ML_MAX_WAIT_MS
+)
+from src.feature_engineering import COLUMNS
 from src.greeks import calculate_greeks
 from src.hedge import delta_hedge
+from src.inference import MicroBatcher
+from src.ml_model import train_model
+from src.model_registry import ModelRegistry
+from src.storage import load_frame
 
 router = APIRouter()
 
+FEATURES = COLUMNS[:-1]
+
+_ml_batcher = None
+
+
+def get_ml_batcher():
+    """Fit (or load from the registry) the ML model and start its batcher."""
+    global _ml_batcher
+
+    if _ml_batcher is None:
+        registry = ModelRegistry(MODEL_REGISTRY_DIR, max_bytes=MODEL_REGISTRY_MAX_BYTES)
+        model, scaler, _ = registry.get_or_train(train_model, load_frame(ML_TRAINING_DATA))
+
+        def predict(X):
+            return model.predict(scaler.transform(pd.DataFrame(X, columns=FEATURES)))
+
+        _ml_batcher = MicroBatcher(predict, ML_MAX_BATCH_SIZE, ML_MAX_WAIT_MS)
+
+    return _ml_batcher
+
+
 @router.get("/price")
 def price_option(
     spot: float,
@@ -29,3 +59,31 @@ def price_option(
         },
         "delta_hedge_shares": round(delta_hedge(delta), 4)
     }
+
+
+@router.get("/ml_price")
+def ml_price_option(
+    spot: float,
+    strike: float,
+    maturity_days: int,
+    volatility: float,
+    risk_free_rate: float
+):
+    T = maturity_days / 365
+
+    bs_price = call_price(spot, strike, T, risk_free_rate, volatility)
+    delta, theta, vega = calculate_greeks(
+        spot, strike, T, risk_free_rate, volatility
+    )
+
+    ml_price = get_ml_batcher().predict([spot, strike, T, volatility, delta, theta, vega])
+
+    return {
+        "black_scholes_price": round(bs_price, 4),
+        "ml_price": round(ml_price, 4)
+    }
+
+
+@router.get("/ml_stats")
+def ml_stats():
+    return get_ml_batcher().stats()
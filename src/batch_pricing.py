@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+FIELDS = ("price", "delta", "gamma", "theta", "vega", "rho")
+SECOND_ORDER_FIELDS = ("vanna", "volga", "charm", "speed", "color")
+
+INV_SQRT_2PI = 1.0 / np.sqrt(2.0 * np.pi)
+
+
+def option_sign(option_type):
+    """
+    +1 for calls, -1 for puts. Accepts "call"/"put", an array of them,
+    or a boolean is-call mask.
+    """
+    option_type = np.asarray(option_type)
+
+    if option_type.dtype == bool:
+        return np.where(option_type, 1.0, -1.0)
+
+    if option_type.ndim == 0:
+        return 1.0 if str(option_type).lower() == "call" else -1.0
+
+    # factorize first so only the handful of distinct labels are lowercased
+    codes, labels = pd.factorize(option_type.ravel())
+    signs = np.array([1.0 if str(label).lower() == "call" else -1.0 for label in labels])
+    return signs[codes].reshape(option_type.shape)
+
+
+def allocate_outputs(shape, fields=FIELDS, dtype=np.float64):
+    return {name: np.empty(shape, dtype=dtype) for name in fields}
+
+
+def price_batch(S, K, T, r, sigma, option_type="call", out=None, second_order=False):
+    """
+    Black-Scholes price, delta, gamma, theta, vega and rho for every
+    (broadcast) contract from one shared d1/d2/pdf/cdf evaluation.
+
+    Theta is per year and vega/rho are per 1.00 change, matching
+    src.greeks. Pass `out` (see allocate_outputs) to reuse result buffers.
+
+    With second_order, vanna, volga, charm, speed and color are added
+    from the same intermediates. Charm and color are per year of time
+    passing (dDelta/dt, dGamma/dt).
+    """
+    sign = option_sign(option_type)
+    S, K, T, r, sigma = (np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma))
+    shape = np.broadcast_shapes(S.shape, K.shape, T.shape, r.shape, sigma.shape, np.shape(sign))
+
+    if out is None:
+        out = allocate_outputs(shape, FIELDS + SECOND_ORDER_FIELDS if second_order else FIELDS)
+
+    sqrt_t = np.sqrt(T)
+    vol_sqrt_t = sigma * sqrt_t
+    discount_k = K * np.exp(-r * T)
+
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    pdf = INV_SQRT_2PI * np.exp(-0.5 * d1 * d1)
+
+    # N(sign * d) gives N(d) for calls and N(-d) for puts without
+    # losing precision to the parity subtraction in the deep tails.
+    cdf1 = ndtr(sign * d1)
+    cdf2 = ndtr(sign * d2)
+
+    price, delta, gamma = out["price"], out["delta"], out["gamma"]
+    theta, vega, rho = out["theta"], out["vega"], out["rho"]
+
+    np.multiply(S, cdf1, out=price)
+    price -= discount_k * cdf2
+    price *= sign
+
+    np.multiply(sign, cdf1, out=delta)
+
+    np.divide(pdf, S * vol_sqrt_t, out=gamma)
+
+    np.multiply(S * pdf, sqrt_t, out=vega)
+
+    np.multiply(discount_k * T, cdf2, out=rho)
+    rho *= sign
+
+    np.multiply(S * pdf, sigma / (2 * sqrt_t), out=theta)
+    np.negative(theta, out=theta)
+    theta -= sign * r * discount_k * cdf2
+
+    if second_order:
+        # d(d1)/dT term shared by charm and color
+        decay = (2 * r * T - d2 * vol_sqrt_t) / (2 * T * vol_sqrt_t)
+
+        np.multiply(-pdf, d2 / sigma, out=out["vanna"])
+        np.multiply(vega, d1 * d2 / sigma, out=out["volga"])
+        np.multiply(-pdf, decay, out=out["charm"])
+        np.multiply(-gamma / S, d1 / vol_sqrt_t + 1, out=out["speed"])
+        np.multiply(gamma / (2 * T), 2 * T * decay * d1 + 1, out=out["color"])
+
+    return out
@@ -1,7 +1,24 @@
-import numpy as np
-from scipy.stats import norm
+from src.batch_pricing import price_batch
+from src.lattice import american_price_batch
+from src.scalar_pricing import is_scalar, price_scalar
 
-def call_price(S, K, T, r, sigma):
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
-    d2 = d1 - sigma * np.sqrt(T)
-    return S * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+
+def _price(S, K, T, r, sigma, option_type, exercise):
+    if exercise == "american":
+        return american_price_batch(S, K, T, r, sigma, option_type, greeks=False)["price"][()]
+
+    if exercise != "european":
+        raise ValueError(f"Unknown exercise style: {exercise}")
+
+    if is_scalar(S, K, T, r, sigma):
+        return price_scalar(S, K, T, r, sigma, option_type)["price"]
+
+    return price_batch(S, K, T, r, sigma, option_type)["price"][()]
+
+
+def call_price(S, K, T, r, sigma, exercise="european"):
+    return _price(S, K, T, r, sigma, "call", exercise)
+
+
+def put_price(S, K, T, r, sigma, exercise="european"):
+    return _price(S, K, T, r, sigma, "put", exercise)
@@ -0,0 +1,78 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: refills at `rate` tokens per second up to
+    `capacity`, and acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens=1):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+def call_with_retry(fn, *args, retries=3, backoff=0.5, max_backoff=8.0, limiter=None):
+    """
+    fn(*args), retried up to `retries` more times on any exception with
+    jittered exponential backoff. Every attempt waits on the limiter.
+    """
+    for attempt in range(retries + 1):
+        if limiter is not None:
+            limiter.acquire()
+        try:
+            return fn(*args)
+        except Exception:
+            if attempt == retries:
+                raise
+            delay = min(max_backoff, backoff * 2**attempt)
+            time.sleep(delay * random.uniform(0.5, 1.0))
+
+
+def bulk_fetch(tickers, fetch_fn, max_workers=8, rate=4.0, burst=None, retries=3, backoff=0.5):
+    """
+    Run fetch_fn(ticker) for many tickers on a bounded thread pool, with
+    all requests sharing one token bucket (`rate` per second, `burst`
+    at once). A ticker that still fails after its retries does not affect
+    the others.
+
+    Returns (results, errors): dicts keyed by ticker, in input order.
+    """
+    tickers = list(dict.fromkeys(tickers))
+    limiter = TokenBucket(rate, burst)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(tickers) or 1)) as pool:
+        futures = {
+            ticker: pool.submit(call_with_retry, fetch_fn, ticker,
+                                retries=retries, backoff=backoff, limiter=limiter)
+            for ticker in tickers
+        }
+
+    results, errors = {}, {}
+    for ticker, future in futures.items():
+        try:
+            results[ticker] = future.result()
+        except Exception as e:
+            errors[ticker] = e
+
+    return results, errors
@@ -0,0 +1,200 @@
+import numpy as np
+import pandas as pd
+
+EPOCH = np.datetime64("1970-01-01", "D")
+
+def _small_int(values):
+    for dtype in (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if len(values) == 0 or (values.min() >= info.min and values.max() <= info.max):
+            return values.astype(dtype)
+    return values
+
+
+def _day_strings(days, fmt):
+    unique, inverse = np.unique(days, return_inverse=True)
+    return pd.to_datetime(unique.astype("datetime64[D]")).strftime(fmt).to_numpy(object)[inverse]
+
+
+def _take(categories, codes):
+    # arrow-backed take for string tables, so pandas doesn't re-infer every row
+    if pd.api.types.infer_dtype(categories, skipna=True) == "string":
+        return pd.array(categories, dtype="str").take(codes)
+    return categories[codes]
+
+
+def _occ_symbols(tickers, expiry_days, option_types, strike_milli):
+    # OCC symbol, e.g. AAPL261120C00185000
+    side = np.where(option_types == "call", "C", "P").astype(object)
+    unique, inverse = np.unique(strike_milli, return_inverse=True)
+    strike = np.array([f"{k:08d}" for k in unique.tolist()], dtype=object)[inverse]
+    return tickers.astype(object) + _day_strings(expiry_days, "%y%m%d") + side + strike
+
+
+class CompactChain:
+    """
+    Column store for load_option_chain frames. String columns become
+    small integer codes into per-column categories, expiry becomes int32
+    days since 1970-01-01 and strike int32 thousandths (the OCC
+    convention). Other float columns are float32, which keeps prices to
+    about 7 significant digits and IV far below quote precision, unless
+    exact=True. contractSymbol is dropped when it can be rebuilt exactly
+    from ticker/expiry/type/strike. Missing values in string columns
+    round-trip; object columns of mixed types are kept as they are.
+
+    Rows are sorted by (expiry, ticker, strike, option_type), so one
+    expiry, or one expiry of one ticker, is a contiguous slice and
+    slice() returns views. With exact=True the input row order is also
+    kept, and to_frame() of the whole chain gives back the input frame.
+    """
+
+    def __init__(self, columns, categories, symbols=None, timezones=None, column_order=None, row_order=None):
+        self.columns = columns
+        self.categories = categories
+        self.symbols = symbols
+        self.timezones = timezones or {}
+        self.column_order = column_order
+        self.row_order = row_order
+
+    @classmethod
+    def from_frame(cls, options_df, exact=False):
+        expiry_days = (pd.to_datetime(options_df["expiry"]).to_numpy().astype("datetime64[D]") - EPOCH)
+        expiry_days = expiry_days.astype(np.int32)
+
+        strike = options_df["strike"].to_numpy(dtype=np.float64)
+        strike_milli = np.round(strike * 1000)
+        if not np.array_equal(strike_milli / 1000, strike):
+            raise ValueError("Strikes are not whole thousandths")
+        strike_milli = strike_milli.astype(np.int32)
+
+        ticker_codes, ticker_categories = pd.factorize(options_df["ticker"], sort=True)
+        type_codes, type_categories = pd.factorize(options_df["option_type"], sort=True)
+        if (ticker_codes < 0).any() or (type_codes < 0).any():
+            raise ValueError("Missing ticker or option_type")
+        order = np.lexsort((type_codes, strike_milli, ticker_codes, expiry_days))
+
+        columns = {"expiry": expiry_days[order], "strike": strike_milli[order]}
+        categories = {
+            "ticker": np.asarray(ticker_categories, dtype=object),
+            "option_type": np.asarray(type_categories, dtype=object),
+        }
+        columns["ticker"] = _small_int(ticker_codes)[order]
+        columns["option_type"] = _small_int(type_codes)[order]
+        timezones = {}
+
+        for name, values in options_df.items():
+            if name in columns or name == "contractSymbol":
+                continue
+            if isinstance(values.dtype, pd.DatetimeTZDtype):
+                timezones[name] = str(values.dt.tz)
+                values = values.dt.tz_convert("UTC").dt.tz_localize(None)
+            values = values.to_numpy()[order]
+
+            if values.dtype == object:
+                try:
+                    codes, uniques = pd.factorize(values, sort=True)
+                except TypeError:
+                    columns[name] = values  # mixed types, no order to sort by
+                    continue
+                categories[name] = np.asarray(uniques, dtype=object)
+                if (codes < 0).any():
+                    # missing values get a trailing category, which code -1 picks
+                    categories[name] = np.append(categories[name], values[codes < 0][:1])
+                columns[name] = _small_int(codes)
+            elif values.dtype == np.float64 and not exact:
+                columns[name] = values.astype(np.float32)
+            elif values.dtype == np.int64:
+                columns[name] = _small_int(values)
+            else:
+                columns[name] = values
+
+        chain = cls(columns, categories, timezones=timezones, column_order=list(options_df.columns))
+        if exact:
+            chain.row_order = np.argsort(order).astype(np.int32)
+
+        if "contractSymbol" in options_df.columns:
+            symbols = options_df["contractSymbol"].to_numpy()[order]
+            if not np.array_equal(symbols.astype(object), chain._rebuilt_symbols()):
+                chain.symbols = np.asarray(symbols, dtype=object)
+
+        return chain
+
+    def __len__(self):
+        return len(self.columns["expiry"])
+
+    def _decode(self, name):
+        return self.categories[name][self.columns[name]]
+
+    def _rebuilt_symbols(self):
+        return _occ_symbols(self._decode("ticker"), self.columns["expiry"],
+                            self._decode("option_type"), self.columns["strike"])
+
+    @property
+    def expiries(self):
+        return np.unique(self.columns["expiry"]).astype("datetime64[D]")
+
+    def _bounds(self, expiry, ticker=None):
+        day = (np.datetime64(pd.Timestamp(expiry), "D") - EPOCH).astype(np.int32)
+        start, stop = np.searchsorted(self.columns["expiry"], [day, day + 1])
+
+        if ticker is not None:
+            code = np.searchsorted(self.categories["ticker"], ticker)
+            if code == len(self.categories["ticker"]) or self.categories["ticker"][code] != ticker:
+                return start, start
+            tickers = self.columns["ticker"][start:stop]
+            start, stop = start + np.searchsorted(tickers, [code, code + 1])
+
+        return start, stop
+
+    def slice(self, expiry, ticker=None):
+        """One expiry (optionally of one ticker) as a chain of views into this one."""
+        start, stop = self._bounds(expiry, ticker)
+        symbols = None if self.symbols is None else self.symbols[start:stop]
+        return CompactChain({name: values[start:stop] for name, values in self.columns.items()},
+                            self.categories, symbols, self.timezones, self.column_order)
+
+    def to_frame(self):
+        """
+        Decode back to a load_option_chain-style frame, in (expiry, ticker,
+        strike) order unless the input row order was kept.
+        """
+        data = {}
+        symbols = self.symbols if self.symbols is not None else self._rebuilt_symbols()
+        data["contractSymbol"] = symbols
+
+        for name, values in self.columns.items():
+            if name == "expiry":
+                data[name] = _day_strings(values, "%Y-%m-%d")
+            elif name == "strike":
+                data[name] = values / 1000
+            elif name in self.categories:
+                data[name] = _take(self.categories[name], values)
+            elif name in self.timezones:
+                data[name] = pd.DatetimeIndex(values).tz_localize("UTC").tz_convert(self.timezones[name])
+            elif values.dtype == np.float32:
+                data[name] = values.astype(np.float64)
+            else:
+                data[name] = values
+
+        if self.row_order is not None:
+            data = {name: values[self.row_order] for name, values in data.items()}
+        frame = pd.DataFrame(data)
+        if self.column_order is None:
+            return frame
+        order = [c for c in self.column_order if c in frame]
+        return frame[order + [c for c in frame if c not in order]]
+
+    def memory_usage(self):
+        """Bytes per column, including category tables and kept symbols."""
+        usage = {}
+        for name, values in self.columns.items():
+            usage[name] = values.nbytes
+            if name in self.categories:
+                usage[name] += int(pd.Series(self.categories[name]).memory_usage(deep=True, index=False))
+
+        usage["contractSymbol"] = 0 if self.symbols is None else \
+            int(pd.Series(self.symbols).memory_usage(deep=True, index=False))
+        if self.row_order is not None:
+            usage["row_order"] = self.row_order.nbytes
+        usage["total"] = sum(usage.values())
+        return usage
@@ -3,3 +3,27 @@ TICKERS = ["AAPL", "MSFT", "NVDA", "TSLA", "AMZN", "META", "GOOGL"]
 RISK_FREE_RATE = 0.05
 TRADING_DAYS = 252
 RANDOM_STATE = 42
+
+MODEL_REGISTRY_DIR = "models"
+MODEL_REGISTRY_MAX_BYTES = 512 * 2**20
+
+ML_TRAINING_DATA = "data/processed/options_dataset.csv"
+ML_MAX_BATCH_SIZE = 64
+ML_MAX_WAIT_MS = 2.0
+
+# daily bars per ticker, see src/price_cache.py
+PRICE_CACHE_DIR = "data/cache/prices"
+PRICE_CACHE_TTL_SECONDS = 3600
+
+# extension for data/raw and data/processed artifacts: .parquet, .feather
+# or .cols (memory-mapped .npy columns), see src/storage.py
+STORAGE_FORMAT = ".parquet"
+
+# concurrent market data fetches, see src/bulk_fetch.py
+FETCH_MAX_WORKERS = 8
+FETCH_RATE_PER_SECOND = 4.0
+FETCH_RETRIES = 3
+
+# option chains, see src/option_chain.py
+CHAIN_MAX_WORKERS = 8
+CHAIN_CACHE_TTL_SECONDS = 300
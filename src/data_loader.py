@@ -1,8 +1,15 @@
-import yfinance as yf
-import numpy as np
+from src.config import PRICE_CACHE_DIR, PRICE_CACHE_TTL_SECONDS
+from src.price_cache import PriceCache
+
+_cache = None
+
+
+def get_price_cache():
+    global _cache
+    if _cache is None:
+        _cache = PriceCache(root=PRICE_CACHE_DIR, ttl_seconds=PRICE_CACHE_TTL_SECONDS)
+    return _cache
+
 
 def load_stock_data(ticker, period="1y"):
-    stock = yf.Ticker(ticker)
-    data = stock.history(period=period)
-    data["returns"] = np.log(data["Close"] / data["Close"].shift(1))
-    return data.dropna()
+    return get_price_cache().load(ticker, period)
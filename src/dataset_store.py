@@ -0,0 +1,141 @@
+import datetime
+import os
+import threading
+import uuid
+from contextlib import ExitStack
+
+import pandas as pd
+from src.global_dataset import _global_option_features
+from src.storage import GLOBAL_SCHEMA, apply_schema, save_frame
+
+KEY_COLUMNS = ["Ticker", "Expiry", "Strike", "OptionType", "Snapshot"]
+
+
+def _date_only(value):
+    if isinstance(value, str):
+        return ":" not in value
+    return isinstance(value, datetime.date) and not isinstance(value, datetime.datetime)
+
+
+class GlobalDatasetStore:
+    """
+    Incremental home for the global options dataset. Rows are appended per
+    chain snapshot into Parquet files partitioned by ticker and snapshot
+    date, so a refresh only reads the partitions it touches and reads
+    only open the partitions asked for:
+
+        <root>/ticker=AAPL/date=2026-10-17/part-20261017T153000-3f9c2a1b.parquet
+
+    Appends hold a per-ticker lock from the duplicate check to the write,
+    so threads sharing a store skip each other's rows.
+    """
+
+    def __init__(self, root="data/processed/global_options"):
+        self.root = root
+        self._locks = {}
+
+    def _partition_dir(self, ticker, date):
+        return os.path.join(self.root, f"ticker={ticker}", f"date={date:%Y-%m-%d}")
+
+    def _partitions(self, tickers=None, start=None, end=None):
+        if not os.path.isdir(self.root):
+            return []
+
+        start = None if start is None else pd.Timestamp(start).normalize()
+        end = None if end is None else pd.Timestamp(end)
+        wanted = None if tickers is None else set(tickers)
+
+        found = []
+        for ticker_dir in sorted(os.listdir(self.root)):
+            ticker = ticker_dir.partition("=")[2]
+            if wanted is not None and ticker not in wanted:
+                continue
+
+            for date_dir in sorted(os.listdir(os.path.join(self.root, ticker_dir))):
+                date = pd.Timestamp(date_dir.partition("=")[2])
+                if (start is None or date >= start) and (end is None or date <= end):
+                    found.append(os.path.join(self.root, ticker_dir, date_dir))
+
+        return found
+
+    def _files(self, partitions):
+        return [
+            os.path.join(path, name)
+            for path in partitions
+            for name in sorted(os.listdir(path))
+            if name.endswith(".parquet")
+        ]
+
+    def _existing_keys(self, tickers, date):
+        partitions = [self._partition_dir(ticker, date) for ticker in tickers]
+        files = self._files([p for p in partitions if os.path.isdir(p)])
+        if not files:
+            return pd.DataFrame(columns=KEY_COLUMNS)
+
+        return pd.concat([pd.read_parquet(f, columns=KEY_COLUMNS) for f in files], ignore_index=True)
+
+    def append_snapshot(self, option_df, risk_free_rate, snapshot_time=None):
+        """
+        Add one load_option_chain snapshot. Contracts already stored for
+        the same snapshot time are skipped. Returns a small report.
+        """
+        snapshot = pd.Timestamp.now() if snapshot_time is None else pd.Timestamp(snapshot_time)
+        snapshot = snapshot.floor("s")
+
+        keys = pd.DataFrame({
+            "Ticker": option_df["ticker"].to_numpy(),
+            "Expiry": pd.to_datetime(option_df["expiry"], errors="coerce").to_numpy(),
+            "Strike": pd.to_numeric(option_df["strike"], errors="coerce").to_numpy(),
+            "OptionType": option_df["option_type"].to_numpy(),
+            "Snapshot": snapshot,
+        }, index=option_df.index)
+
+        tickers = sorted(keys["Ticker"].dropna().unique())
+        with ExitStack() as stack:
+            # sorted, so concurrent appends of overlapping tickers can't deadlock
+            for ticker in tickers:
+                stack.enter_context(self._locks.setdefault(ticker, threading.Lock()))
+
+            existing = self._existing_keys(tickers, snapshot)
+            seen = pd.MultiIndex.from_frame(existing.astype(keys.dtypes.to_dict()))
+            fresh = ~pd.MultiIndex.from_frame(keys).isin(seen) & ~keys.duplicated()
+
+            features, dropped = _global_option_features(option_df[fresh], risk_free_rate, today=snapshot)
+            rows = features.join(keys[["Expiry", "OptionType", "Snapshot"]])
+
+            for ticker, part in rows.groupby("Ticker", sort=False):
+                path = self._partition_dir(ticker, snapshot)
+                os.makedirs(path, exist_ok=True)
+                # unique by construction, also across processes
+                name = f"part-{snapshot:%Y%m%dT%H%M%S}-{uuid.uuid4().hex[:8]}.parquet"
+                save_frame(part, os.path.join(path, name), GLOBAL_SCHEMA)
+
+        return {
+            "snapshot": snapshot,
+            "input_rows": len(option_df),
+            "skipped_rows": int((~fresh).sum()),
+            "written_rows": len(rows),
+            "dropped": dropped,
+        }
+
+    def read(self, tickers=None, start=None, end=None, columns=None):
+        """
+        Load rows for the given tickers and snapshot time range, both ends
+        inclusive; a date-only end ("2026-10-16") covers that whole day.
+        Only the matching partitions are opened.
+        """
+        files = self._files(self._partitions(tickers, start, end))
+        if not files:
+            return pd.DataFrame(columns=columns)
+
+        # per-file categories differ, so re-type after the concat
+        df = apply_schema(pd.concat([pd.read_parquet(f) for f in files], ignore_index=True), GLOBAL_SCHEMA)
+
+        if start is not None:
+            df = df[df["Snapshot"] >= pd.Timestamp(start)]
+        if end is not None and _date_only(end):
+            df = df[df["Snapshot"] < pd.Timestamp(end) + pd.Timedelta(days=1)]
+        elif end is not None:
+            df = df[df["Snapshot"] <= pd.Timestamp(end)]
+
+        return df.reset_index(drop=True) if columns is None else df[columns].reset_index(drop=True)
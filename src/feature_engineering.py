@@ -1,25 +1,101 @@
+import warnings
+
 import numpy as np
 import pandas as pd
-from src.black_scholes import call_price
-from src.greeks import calculate_greeks
+from scipy.stats import qmc
+from src.batch_pricing import price_batch
+
+COLUMNS = ["Spot", "Strike", "T", "Vol", "Delta", "Theta", "Vega", "MarketPrice"]
+SAMPLING = ("uniform", "sobol", "halton")
+
+# >1 pulls spot/strike multipliers towards 1 (ATM) and T towards the query maturity
+STRATIFY_POWER = 2.0
+T_RANGE = (0.01, 0.5)
+
+
+def _unit_sampler(rng, sampling):
+    """Callable n -> (n, 4) points in [0, 1) for the S, K, T, vol multipliers."""
+    if sampling == "uniform":
+        return lambda n: rng.random((n, 4))
+
+    if sampling not in SAMPLING:
+        raise ValueError(f"Unknown sampling design: {sampling}")
+
+    engine_cls = qmc.Sobol if sampling == "sobol" else qmc.Halton
+    engine = engine_cls(d=4, scramble=True, seed=rng)
+
+    def draw(n):
+        # Sobol warns when n is not a power of two; the points are still valid
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", UserWarning)
+            return engine.random(n)
+
+    return draw
+
+
+def _toward(u, centre):
+    # power warp of [0, 1) onto itself that pulls points towards centre
+    span = np.where(u < centre, centre, 1 - centre)
+    t = (u - centre) / np.where(span > 0, span, 1.0)
+    return centre + span * np.sign(t) * np.abs(t) ** STRATIFY_POWER
+
+
+def _stratify(u, T=None):
+    u = u.copy()
+    u[:, :2] = _toward(u[:, :2], 0.5)
+    if T is not None:
+        u[:, 2] = _toward(u[:, 2], np.clip((T - T_RANGE[0]) / (T_RANGE[1] - T_RANGE[0]), 0.0, 1.0))
+    return u
+
+
+def _sample_block(rng, u, S, K, r, base_vol):
+    n = len(u)
+    S_ = S * (0.9 + 0.2 * u[:, 0])
+    K_ = K * (0.9 + 0.2 * u[:, 1])
+    T_ = T_RANGE[0] + (T_RANGE[1] - T_RANGE[0]) * u[:, 2]
+    sigma_ = base_vol * (0.7 + 0.6 * u[:, 3])
+
+    greeks = price_batch(S_, K_, T_, r, sigma_, "call")
+    market_price = greeks["price"] + rng.normal(0, 0.5, n)
+
+    return np.column_stack([
+        S_, K_, T_, sigma_,
+        greeks["delta"], greeks["theta"], greeks["vega"],
+        market_price
+    ])
+
+
+def generate_option_samples(S, K, r, base_vol, n=1000, seed=None, sampling="uniform", stratify=False, T=None):
+    """
+    Synthetic training rows around (S, K, base_vol). sampling="sobol" or
+    "halton" uses a scrambled low-discrepancy design over the same ranges;
+    stratify concentrates rows near ATM and, given the query maturity T,
+    near that maturity. Stratified sets fit the neighbourhood better and
+    the rest of the ranges worse.
+    """
+    rng = np.random.default_rng(seed)
+    u = _unit_sampler(rng, sampling)(n)
 
-def generate_option_samples(S, K, r, base_vol, n=1000):
-    rows = []
+    if stratify:
+        u = _stratify(u, T)
 
-    for _ in range(n):
-        S_ = S * np.random.uniform(0.9, 1.1)
-        K_ = K * np.random.uniform(0.9, 1.1)
-        T_ = np.random.uniform(0.01, 0.5)
-        sigma_ = base_vol * np.random.uniform(0.7, 1.3)
+    return pd.DataFrame(_sample_block(rng, u, S, K, r, base_vol), columns=COLUMNS)
 
-        price = call_price(S_, K_, T_, r, sigma_)
-        delta, theta, vega = calculate_greeks(S_, K_, T_, r, sigma_)
 
-        market_price = price + np.random.normal(0, 0.5)
+def iter_option_samples(S, K, r, base_vol, n, chunk_size=100_000, seed=None, as_frame=True,
+                        sampling="uniform", stratify=False, T=None):
+    """
+    Draw the same distribution as generate_option_samples in blocks of at most
+    chunk_size rows, so very large training sets never sit in memory at once.
+    Low-discrepancy designs continue one sequence across blocks.
+    """
+    rng = np.random.default_rng(seed)
+    draw = _unit_sampler(rng, sampling)
 
-        rows.append([S_, K_, T_, sigma_, delta, theta, vega, market_price])
+    for start in range(0, n, chunk_size):
+        u = draw(min(chunk_size, n - start))
+        if stratify:
+            u = _stratify(u, T)
 
-    return pd.DataFrame(
-        rows,
-        columns=["Spot", "Strike", "T", "Vol", "Delta", "Theta", "Vega", "MarketPrice"]
-    )
+        block = _sample_block(rng, u, S, K, r, base_vol)
+        yield pd.DataFrame(block, columns=COLUMNS) if as_frame else block
@@ -1,33 +1,73 @@
 import numpy as np
 import pandas as pd
-from src.greeks import calculate_greeks
-
-def build_global_option_dataset(option_df, risk_free_rate):
-    rows = []
-
-    for _, row in option_df.iterrows():
-        try:
-            S = row["lastPrice"] + row["strike"]  # proxy spot (rough but ok)
-            K = row["strike"]
-            T = pd.to_datetime(row["expiry"])
-            today = pd.Timestamp.today()
-            T = max((T - today).days / 365, 1/365)
-
-            sigma = row["impliedVolatility"]
-
-            delta, theta, vega = calculate_greeks(S, K, T, risk_free_rate, sigma)
-
-            rows.append([
-                row["ticker"],
-                S, K, T, sigma,
-                delta, theta, vega,
-                row["lastPrice"]
-            ])
-        except:
-            continue
-
-    return pd.DataFrame(rows, columns=[
-        "Ticker", "Spot", "Strike", "T", "IV",
-        "Delta", "Theta", "Vega",
-        "MarketPrice"
-    ])
+from src.batch_pricing import price_batch
+
+COLUMNS = [
+    "Ticker", "Spot", "Strike", "T", "IV",
+    "Delta", "Theta", "Vega",
+    "MarketPrice"
+]
+
+
+def _global_option_features(option_df, risk_free_rate, today=None):
+    """
+    Columnar core of build_global_option_dataset. Keeps the input index
+    of the surviving rows and returns (features, dropped) where dropped
+    counts rejected rows by the first reason that applies.
+    """
+    today = pd.Timestamp.today() if today is None else pd.Timestamp(today)
+
+    last = pd.to_numeric(option_df["lastPrice"], errors="coerce").to_numpy(dtype=float)
+    K = pd.to_numeric(option_df["strike"], errors="coerce").to_numpy(dtype=float)
+    sigma = pd.to_numeric(option_df["impliedVolatility"], errors="coerce").to_numpy(dtype=float)
+
+    # one parse (cached per distinct expiry) and one reference timestamp for all rows
+    expiry = pd.to_datetime(option_df["expiry"], errors="coerce")
+    T = np.maximum((expiry - today).dt.days.to_numpy(dtype=float) / 365, 1 / 365)
+
+    S = last + K  # proxy spot (rough but ok)
+
+    checks = [
+        ("missing_value", np.isnan(last) | np.isnan(K) | np.isnan(sigma) | option_df["ticker"].isna().to_numpy()),
+        ("bad_expiry", expiry.isna().to_numpy()),
+        ("non_positive_input", (K <= 0) | (S <= 0) | (sigma <= 0)),
+    ]
+
+    invalid = np.zeros(len(option_df), dtype=bool)
+    dropped = {}
+    for reason, mask in checks:
+        dropped[reason] = int(np.count_nonzero(mask & ~invalid))
+        invalid |= mask
+
+    keep = ~invalid
+    with np.errstate(all="ignore"):
+        greeks = price_batch(S[keep], K[keep], T[keep], risk_free_rate, sigma[keep], "call")
+
+    finite = np.isfinite(greeks["delta"]) & np.isfinite(greeks["theta"]) & np.isfinite(greeks["vega"])
+    dropped["non_finite_greeks"] = int(np.count_nonzero(~finite))
+
+    kept_index = option_df.index[keep][finite]
+    features = pd.DataFrame({
+        "Ticker": option_df["ticker"].to_numpy()[keep][finite],
+        "Spot": S[keep][finite],
+        "Strike": K[keep][finite],
+        "T": T[keep][finite],
+        "IV": sigma[keep][finite],
+        "Delta": greeks["delta"][finite],
+        "Theta": greeks["theta"][finite],
+        "Vega": greeks["vega"][finite],
+        "MarketPrice": last[keep][finite],
+    }, index=kept_index)
+
+    return features, dropped
+
+
+def build_global_option_dataset(option_df, risk_free_rate, return_report=False):
+    features, dropped = _global_option_features(option_df, risk_free_rate)
+    features = features.reset_index(drop=True)
+
+    if return_report:
+        report = {"input_rows": len(option_df), "kept_rows": len(features), "dropped": dropped}
+        return features, report
+
+    return features
@@ -1,14 +1,29 @@
-import numpy as np
-from scipy.stats import norm
+from src.batch_pricing import price_batch
+from src.scalar_pricing import is_scalar, price_scalar
+
 
 def calculate_greeks(S, K, T, r, sigma):
-    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / (sigma * np.sqrt(T))
+    if is_scalar(S, K, T, r, sigma):
+        greeks = price_scalar(S, K, T, r, sigma, "call")
+        return greeks["delta"], greeks["theta"], greeks["vega"]
 
-    delta = norm.cdf(d1)
-    theta = (
-        -S * norm.pdf(d1) * sigma / (2 * np.sqrt(T))
-        - r * K * np.exp(-r * T) * norm.cdf(d1 - sigma * np.sqrt(T))
-    )
-    vega = S * norm.pdf(d1) * np.sqrt(T)
+    greeks = price_batch(S, K, T, r, sigma, "call")
+
+    return greeks["delta"][()], greeks["theta"][()], greeks["vega"][()]
 
-    return delta, theta, vega
+
+def second_order_pnl(greeks, dS, dsigma, dt):
+    """
+    Second-order Taylor estimate of the P&L for a spot move dS, vol move
+    dsigma and dt years passing, from price_batch(..., second_order=True)
+    output. Avoids repricing each scenario.
+    """
+    return (
+        greeks["delta"] * dS
+        + 0.5 * greeks["gamma"] * dS**2
+        + greeks["vega"] * dsigma
+        + 0.5 * greeks["volga"] * dsigma**2
+        + greeks["vanna"] * dS * dsigma
+        + greeks["theta"] * dt
+        + greeks["charm"] * dS * dt
+    )
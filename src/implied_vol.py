@@ -0,0 +1,127 @@
+import numpy as np
+import pandas as pd
+from scipy.special import ndtr
+
+from src.batch_pricing import INV_SQRT_2PI, option_sign
+
+CONVERGED = 0
+MAX_ITER = 1
+NO_ARBITRAGE_VIOLATION = 2
+INVALID_INPUT = 3
+
+STATUS_LABELS = {
+    CONVERGED: "converged",
+    MAX_ITER: "max_iter",
+    NO_ARBITRAGE_VIOLATION: "outside_bounds",
+    INVALID_INPUT: "invalid",
+}
+
+
+def _initial_guess(call, S, discount_k, T):
+    # Corrado-Miller rational approximation, falling back to
+    # Brenner-Subrahmanyam when its square root goes negative.
+    half_gap = call - 0.5 * (S - discount_k)
+    root = np.sqrt(np.maximum(half_gap**2 - (S - discount_k) ** 2 / np.pi, 0.0))
+    guess = np.sqrt(2 * np.pi / T) / (S + discount_k) * (half_gap + root)
+
+    fallback = np.sqrt(2 * np.pi / T) * call / S
+    return np.where(np.isfinite(guess) & (guess > 0), guess, fallback)
+
+
+def implied_vol(price, S, K, T, r, option_type="call", tol=1e-8, max_iter=50, vol_lo=1e-4, vol_hi=5.0):
+    """
+    Invert Black-Scholes for every (broadcast) quote at once.
+
+    Each quote is solved as its out-of-the-money equivalent with
+    safeguarded Halley steps: any step leaving the current bracket falls
+    back to bisection. Returns (iv, status) arrays, see STATUS_LABELS.
+    """
+    sign = option_sign(option_type)
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (price, S, K, T, r, sign)))
+    shape = arrays[0].shape
+    price, S, K, T, r, sign = (a.ravel() for a in arrays)
+
+    iv = np.full(price.shape, np.nan)
+    status = np.full(price.shape, INVALID_INPUT, dtype=np.int8)
+
+    valid = np.isfinite(price) & (price > 0) & (S > 0) & (K > 0) & (T > 0) & np.isfinite(r)
+    discount_k = K * np.exp(-r * T)
+
+    # Put-call parity moves every quote to the OTM side, where the price
+    # carries no intrinsic value and vega is best conditioned.
+    call = np.where(sign > 0, price, price + S - discount_k)
+    otm_sign = np.where(S > discount_k, -1.0, 1.0)
+    target = np.where(otm_sign > 0, call, call - S + discount_k)
+    upper = np.where(otm_sign > 0, S, discount_k)
+
+    in_bounds = (target > 0) & (target < upper)
+    status[valid & ~in_bounds] = NO_ARBITRAGE_VIOLATION
+    solve = np.flatnonzero(valid & in_bounds)
+
+    S_, T_, target_, sign_, discount_k_ = S[solve], T[solve], target[solve], otm_sign[solve], discount_k[solve]
+    log_moneyness = np.log(S_ / discount_k_)
+    sqrt_t = np.sqrt(T_)
+
+    sigma = np.clip(_initial_guess(call[solve], S_, discount_k_, T_), vol_lo, vol_hi)
+    lo = np.full(sigma.shape, vol_lo)
+    hi = np.full(sigma.shape, vol_hi)
+    done = np.zeros(sigma.shape, dtype=bool)
+
+    for _ in range(max_iter):
+        active = np.flatnonzero(~done)
+        if active.size == 0:
+            break
+
+        s, sq, x, sg = sigma[active], sqrt_t[active], log_moneyness[active], sign_[active]
+        d1 = x / (s * sq) + 0.5 * s * sq
+        d2 = d1 - s * sq
+        model = sg * (S_[active] * ndtr(sg * d1) - discount_k_[active] * ndtr(sg * d2))
+        diff = model - target_[active]
+
+        vega = S_[active] * INV_SQRT_2PI * np.exp(-0.5 * d1 * d1) * sq
+        volga = vega * d1 * d2 / s
+
+        lo[active] = np.where(diff < 0, s, lo[active])
+        hi[active] = np.where(diff > 0, s, hi[active])
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            newton = diff / vega
+            step = newton / (1 - 0.5 * newton * volga / vega)
+
+        candidate = s - step
+        inside = np.isfinite(candidate) & (candidate > lo[active]) & (candidate < hi[active])
+        candidate = np.where(inside, candidate, 0.5 * (lo[active] + hi[active]))
+
+        hit = np.abs(diff) <= tol * target_[active]
+        sigma[active] = np.where(hit, s, candidate)
+        done[active] = hit | (np.abs(candidate - s) <= tol * s)
+
+    iv[solve] = sigma
+    status[solve] = np.where(done, CONVERGED, MAX_ITER)
+
+    return iv.reshape(shape), status.reshape(shape)
+
+
+def chain_implied_vol(chain, S, r, as_of=None, **kwargs):
+    """
+    Recompute IV for a load_option_chain frame from bid/ask mids (last
+    price where the book is one-sided). Adds midPrice, iv and iv_status.
+    """
+    chain = chain.copy()
+    as_of = pd.Timestamp.today().normalize() if as_of is None else pd.Timestamp(as_of)
+
+    bid, ask = chain["bid"].to_numpy(float), chain["ask"].to_numpy(float)
+    two_sided = (bid > 0) & (ask > 0)
+    chain["midPrice"] = np.where(two_sided, 0.5 * (bid + ask), chain["lastPrice"].to_numpy(float))
+
+    days = (pd.to_datetime(chain["expiry"]) - as_of).dt.days.to_numpy()
+    T = np.maximum(days / 365, 1 / 365)
+
+    iv, status = implied_vol(
+        chain["midPrice"].to_numpy(), S, chain["strike"].to_numpy(float), T, r,
+        chain["option_type"].to_numpy(), **kwargs
+    )
+
+    chain["iv"] = iv
+    chain["iv_status"] = pd.Series(status, index=chain.index).map(STATUS_LABELS)
+    return chain
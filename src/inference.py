@@ -0,0 +1,104 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+import numpy as np
+
+
+class Histogram:
+    """Fixed-bucket counter; bucket i counts values <= bounds[i], the last one the rest."""
+
+    def __init__(self, bounds):
+        self.bounds = list(bounds)
+        self.counts = [0] * (len(self.bounds) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, values):
+        idx = np.searchsorted(self.bounds, values, side="left")
+        with self._lock:
+            for i in idx:
+                self.counts[i] += 1
+            self.total += len(values)
+            self.sum += float(np.sum(values))
+
+    def snapshot(self):
+        with self._lock:
+            labels = [f"<={b:g}" for b in self.bounds] + [f">{self.bounds[-1]:g}"]
+            return {
+                "buckets": dict(zip(labels, self.counts)),
+                "count": self.total,
+                "mean": self.sum / self.total if self.total else 0.0,
+            }
+
+
+class MicroBatcher:
+    """
+    Collects single-row prediction requests from many threads and runs
+    them through predict_fn as one batch, flushing when max_batch_size
+    rows are queued or the oldest request has waited max_wait_ms.
+    """
+
+    def __init__(self, predict_fn, max_batch_size=64, max_wait_ms=2.0):
+        self.predict_fn = predict_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+
+        self.batch_sizes = Histogram([1, 2, 4, 8, 16, 32, 64, 128, 256])
+        self.queue_wait_ms = Histogram([0.1, 0.25, 0.5, 1, 2, 5, 10, 25, 50])
+
+        self._queue = queue.Queue()
+        self._worker = threading.Thread(target=self._run, name="ml-micro-batcher", daemon=True)
+        self._worker.start()
+
+    def submit(self, features):
+        future = Future()
+        self._queue.put((np.asarray(features, dtype=np.float64), future, time.perf_counter()))
+        return future
+
+    def predict(self, features, timeout=None):
+        return self.submit(features).result(timeout)
+
+    def _collect(self):
+        batch = [self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                # past the deadline, still drain whatever is already queued
+                if remaining > 0:
+                    batch.append(self._queue.get(timeout=remaining))
+                else:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+
+        return batch
+
+    def _run(self):
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+
+            self.batch_sizes.record([len(batch)])
+            self.queue_wait_ms.record([(started - enqueued) * 1000 for _, _, enqueued in batch])
+
+            try:
+                preds = self.predict_fn(np.vstack([features for features, _, _ in batch]))
+            except Exception as e:
+                for _, future, _ in batch:
+                    future.set_exception(e)
+                continue
+
+            for (_, future, _), pred in zip(batch, preds):
+                future.set_result(float(pred))
+
+    def stats(self):
+        return {
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_wait_ms": self.queue_wait_ms.snapshot(),
+            "pending": self._queue.qsize(),
+        }
@@ -0,0 +1,155 @@
+import threading
+
+import numpy as np
+
+from src.batch_pricing import option_sign
+
+DEFAULT_STEPS = 201
+LATTICE_CHUNK = 512  # contracts rolled back together; bounds the workspace
+
+
+class LatticeWorkspace:
+    """
+    Node buffers reused across calls on one thread. Contracts are rolled
+    back LATTICE_CHUNK columns at a time, so the buffers stay at about
+    3 x (steps + 1) x LATTICE_CHUNK floats however large the chain.
+    """
+
+    def __init__(self):
+        self.values = np.empty((0, 0))
+        self.stock = np.empty((0, 0))
+        self.scratch = np.empty((0, 0))
+
+    def get(self, rows, cols):
+        if self.values.shape[0] < rows or self.values.shape[1] < cols:
+            shape = (max(rows, self.values.shape[0]), max(cols, self.values.shape[1]))
+            self.values = np.empty(shape)
+            self.stock = np.empty(shape)
+            self.scratch = np.empty(shape)
+
+        return self.values[:rows, :cols], self.stock[:rows, :cols], self.scratch[:rows, :cols]
+
+
+_local = threading.local()
+
+
+def _thread_workspace():
+    if not hasattr(_local, "workspace"):
+        _local.workspace = LatticeWorkspace()
+    return _local.workspace
+
+
+def _peizer_pratt(z, n):
+    # Peizer-Pratt method 2 inversion of the normal cdf, as used by Leisen-Reimer
+    return 0.5 + np.sign(z) * np.sqrt(
+        0.25 - 0.25 * np.exp(-((z / (n + 1 / 3 + 0.1 / (n + 1))) ** 2) * (n + 1 / 6))
+    )
+
+
+def _backward_induction(S, K, T, r, sigma, sign, steps, workspace):
+    """
+    Roll the tree back for every column at once. Returns the root value
+    plus the step-1 and step-2 node values/prices used for lattice Greeks.
+    """
+    dt = T / steps
+    growth = np.exp(r * dt)
+    discount = 1 / growth
+
+    vol_sqrt_t = sigma * np.sqrt(T)
+    d1 = (np.log(S / K) + (r + 0.5 * sigma**2) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+
+    p = _peizer_pratt(d2, steps)
+    up = growth * _peizer_pratt(d1, steps) / p
+    down = (growth - p * up) / (1 - p)
+
+    values, stock, scratch = workspace.get(steps + 1, S.size)
+
+    ups = np.arange(steps + 1)[:, None]
+    np.exp(np.log(S) + ups * np.log(up) + (steps - ups) * np.log(down), out=stock)
+    np.subtract(stock, K, out=values)
+    values *= sign
+    np.maximum(values, 0, out=values)
+
+    p_discount = p * discount
+    q_discount = (1 - p) * discount
+    nodes = {}
+
+    for i in range(steps - 1, -1, -1):
+        v, s, tmp = values[: i + 1], stock[: i + 1], scratch[: i + 1]
+
+        s /= down
+
+        np.multiply(values[1 : i + 2], p_discount, out=tmp)
+        v *= q_discount
+        v += tmp
+
+        # early exercise
+        np.subtract(s, K, out=tmp)
+        tmp *= sign
+        np.maximum(v, tmp, out=v)
+
+        if i <= 2:
+            nodes[i] = (v.copy(), s.copy())
+
+    return nodes, dt
+
+
+def american_price_batch(S, K, T, r, sigma, option_type="call", steps=DEFAULT_STEPS,
+                         greeks=True, workspace=None):
+    """
+    Leisen-Reimer binomial prices for American options. Every broadcast
+    contract is one column of the lattice, so a whole chain (any mix of
+    strikes and expiries) is rolled back together, LATTICE_CHUNK columns
+    at a time.
+
+    Delta and gamma come from the tree's first two steps; theta, vega and
+    rho are central differences. Units match src.batch_pricing.price_batch.
+    Each thread has its own workspace unless one is passed.
+    """
+    steps = steps + 1 - steps % 2  # Leisen-Reimer needs an odd step count
+    workspace = _thread_workspace() if workspace is None else workspace
+
+    sign = option_sign(option_type)
+    arrays = np.broadcast_arrays(*(np.asarray(x, dtype=np.float64) for x in (S, K, T, r, sigma, sign)))
+    shape = arrays[0].shape
+    flat = [a.ravel() for a in arrays]
+
+    fields = ("price", "delta", "gamma", "theta", "vega", "rho") if greeks else ("price",)
+    result = {name: np.empty(flat[0].size) for name in fields}
+
+    for start in range(0, flat[0].size, LATTICE_CHUNK):
+        chunk = slice(start, start + LATTICE_CHUNK)
+        for name, values in _price_chunk(*(a[chunk] for a in flat), steps, greeks, workspace).items():
+            result[name][chunk] = values
+
+    return {name: values.reshape(shape) for name, values in result.items()}
+
+
+def _price_chunk(S, K, T, r, sigma, sign, steps, greeks, workspace):
+    nodes, dt = _backward_induction(S, K, T, r, sigma, sign, steps, workspace)
+    root = nodes[0][0][0]
+    result = {"price": root}
+
+    if not greeks:
+        return result
+
+    (v1, s1), (v2, s2) = nodes[1], nodes[2]
+    delta_up = (v2[2] - v2[1]) / (s2[2] - s2[1])
+    delta_down = (v2[1] - v2[0]) / (s2[1] - s2[0])
+
+    result["delta"] = (v1[1] - v1[0]) / (s1[1] - s1[0])
+    result["gamma"] = (delta_up - delta_down) / (0.5 * (s2[2] - s2[0]))
+
+    def root_price(T_, r_, sigma_):
+        return _backward_induction(S, K, T_, r_, sigma_, sign, steps, workspace)[0][0][0][0]
+
+    # the tree's middle node two steps in is not at spot (u * d != 1 in
+    # Leisen-Reimer), so theta is bumped like vega and rho
+    time_bump = np.minimum(1 / 365, 0.5 * T)
+    vol_bump, rate_bump = 1e-3, 1e-4
+    result["theta"] = (root_price(T - time_bump, r, sigma) - root_price(T + time_bump, r, sigma)) / (2 * time_bump)
+    result["vega"] = (root_price(T, r, sigma + vol_bump) - root_price(T, r, sigma - vol_bump)) / (2 * vol_bump)
+    result["rho"] = (root_price(T, r + rate_bump, sigma) - root_price(T, r - rate_bump, sigma)) / (2 * rate_bump)
+
+    return result
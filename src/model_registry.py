@@ -0,0 +1,122 @@
+import hashlib
+import inspect
+import os
+import threading
+from collections import OrderedDict
+
+import joblib
+import pandas as pd
+import sklearn
+from src.storage import write_atomic
+
+
+def _code_version(fn):
+    # any edit to the training module invalidates its artifacts
+    with open(inspect.getsourcefile(fn), "rb") as f:
+        source = f.read()
+    return hashlib.sha256(source).hexdigest()
+
+
+class ModelRegistry:
+    """
+    Disk-backed cache of fitted training results (e.g. the (model, scaler,
+    mae) tuple from src.ml_model.train_model), keyed by a hash of the
+    training frame, parameters and training code version.
+
+    Artifacts are joblib files loaded with mmap_mode="r". That maps plain
+    numpy arrays (e.g. HistGradientBoosting predictor nodes), but sklearn's
+    Tree copies its nodes on unpickle, so a random forest disk hit reads
+    the whole model into memory; FlatEnsemble.save/load in src.tree_export
+    is the lazily paged form. A small in-process LRU keeps hot entries, and
+    the directory is trimmed to max_bytes by least recent use. One registry
+    can be shared by threads (e.g. through st.cache_resource); concurrent
+    misses on a key may both train, and the last write wins.
+    """
+
+    def __init__(self, root="models", max_bytes=512 * 2**20, max_in_memory=4):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.max_in_memory = max_in_memory
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._evict_lock = threading.Lock()
+
+    def key(self, train_fn, df, **params):
+        h = hashlib.sha256()
+        h.update(f"{train_fn.__module__}.{train_fn.__qualname__}".encode())
+        h.update(_code_version(train_fn).encode())
+        h.update(sklearn.__version__.encode())
+        h.update(repr(sorted(params.items())).encode())
+        h.update(repr(list(df.columns)).encode())
+        h.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+        return h.hexdigest()[:32]
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.joblib")
+
+    def _recall(self, key):
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                return self._memory[key]
+        return None
+
+    def _remember(self, key, result):
+        with self._lock:
+            self._memory[key] = result
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_in_memory:
+                self._memory.popitem(last=False)
+
+    def _evict(self, keep):
+        with self._evict_lock:
+            self._evict_files(keep)
+
+    def _evict_files(self, keep):
+        files = []
+        for name in os.listdir(self.root):
+            path = os.path.join(self.root, name)
+            if name.endswith(".joblib") and path != keep:
+                try:
+                    files.append((os.path.getatime(path), os.path.getsize(path), path))
+                except FileNotFoundError:
+                    pass  # evicted by another thread or process
+        files.sort()
+
+        total = sum(size for _, size, _ in files)
+        if os.path.exists(keep):
+            total += os.path.getsize(keep)
+        for _, size, path in files:
+            if total <= self.max_bytes:
+                break
+            total -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _save(self, result, path):
+        write_atomic(path, lambda tmp_path: joblib.dump(result, tmp_path))
+        self._evict(keep=path)
+
+    def get_or_train(self, train_fn, df, **params):
+        key = self.key(train_fn, df, **params)
+
+        result = self._recall(key)
+        if result is not None:
+            return result
+
+        path = self._path(key)
+        try:
+            result = joblib.load(path, mmap_mode="r")
+        except FileNotFoundError:
+            result = train_fn(df, **params)
+            self._save(result, path)
+        else:
+            try:
+                os.utime(path)  # mark as recently used for eviction
+            except FileNotFoundError:
+                pass  # evicted since loading; the mapped arrays stay valid
+
+        self._remember(key, result)
+        return result
@@ -0,0 +1,112 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from src.black_scholes import call_price, put_price
+from src.config import RANDOM_STATE
+
+PAYOFFS = ("european", "asian", "up_and_out", "down_and_out", "up_and_in", "down_and_in")
+
+
+def _simulate_chunk(task):
+    """
+    Simulate one fixed-size block of GBM paths and return running sums,
+    so chunks can be combined without keeping any paths around.
+    """
+    seed, n_paths, S, K, T, r, sigma, sign, payoff, barrier, n_steps, antithetic = task
+    rng = np.random.Generator(np.random.PCG64(seed))
+
+    dt = T / n_steps
+    drift = (r - 0.5 * sigma**2) * dt
+    diffusion = sigma * np.sqrt(dt)
+
+    n_draws = n_paths // 2 if antithetic else n_paths
+    z = rng.standard_normal((n_draws, n_steps))
+    if antithetic:
+        z = np.concatenate([z, -z])
+
+    log_paths = np.cumsum(drift + diffusion * z, axis=1)
+    paths = S * np.exp(log_paths, out=log_paths)
+    terminal = paths[:, -1]
+
+    discount = np.exp(-r * T)
+    european = discount * np.maximum(sign * (terminal - K), 0)
+
+    if payoff == "european":
+        y = european
+    elif payoff == "asian":
+        y = discount * np.maximum(sign * (paths.mean(axis=1) - K), 0)
+    else:
+        if payoff.startswith("up"):
+            crossed = paths.max(axis=1) >= barrier
+        else:
+            crossed = paths.min(axis=1) <= barrier
+        alive = ~crossed if payoff.endswith("out") else crossed
+        y = np.where(alive, european, 0.0)
+
+    x = european
+    if antithetic:
+        # each antithetic pair is one independent sample
+        y = 0.5 * (y[:n_draws] + y[n_draws:])
+        x = 0.5 * (x[:n_draws] + x[n_draws:])
+
+    return np.array([y.size, y.sum(), (y * y).sum(), x.sum(), (x * x).sum(), (x * y).sum()])
+
+
+def mc_price(S, K, T, r, sigma, option_type="call", payoff="asian", barrier=None,
+             n_paths=200_000, n_steps=252, chunk_size=20_000, antithetic=True,
+             control_variate=True, workers=1, seed=RANDOM_STATE):
+    """
+    Monte Carlo price for European, arithmetic Asian and discretely
+    monitored barrier options under GBM.
+
+    Paths are simulated chunk_size at a time (memory is bounded by one
+    chunk per worker), each chunk with its own spawned seed, so the
+    result for a given seed does not depend on scheduling. With
+    control_variate the European payoff is used against the analytic
+    Black-Scholes price.
+    """
+    if payoff not in PAYOFFS:
+        raise ValueError(f"Unknown payoff: {payoff}")
+    if payoff not in ("european", "asian") and barrier is None:
+        raise ValueError("Barrier payoffs need a barrier level")
+
+    sign = 1.0 if option_type.lower() == "call" else -1.0
+    chunk_size += chunk_size % 2 if antithetic else 0
+    n_chunks = -(-n_paths // chunk_size)
+
+    children = np.random.SeedSequence(seed).spawn(n_chunks)
+    tasks = [
+        (child, chunk_size, S, K, T, r, sigma, sign, payoff, barrier, n_steps, antithetic)
+        for child in children
+    ]
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            sums = list(pool.map(_simulate_chunk, tasks))
+    else:
+        sums = [_simulate_chunk(task) for task in tasks]
+
+    n, sum_y, sum_y2, sum_x, sum_x2, sum_xy = np.sum(sums, axis=0)
+
+    mean_y = sum_y / n
+    var_y = (sum_y2 - n * mean_y**2) / (n - 1)
+    beta = 0.0
+
+    if control_variate:
+        mean_x = sum_x / n
+        var_x = (sum_x2 - n * mean_x**2) / (n - 1)
+        cov_xy = (sum_xy - n * mean_x * mean_y) / (n - 1)
+
+        if var_x > 0:
+            beta = cov_xy / var_x
+            analytic = call_price(S, K, T, r, sigma) if sign > 0 else put_price(S, K, T, r, sigma)
+            mean_y = mean_y - beta * (mean_x - analytic)
+            var_y = var_y - cov_xy**2 / var_x
+
+    return {
+        "price": mean_y,
+        "std_error": np.sqrt(max(var_y, 0.0) / n),
+        "n_paths": int(n_chunks * chunk_size),
+        "beta": beta,
+    }
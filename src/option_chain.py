@@ -1,21 +1,119 @@
-import yfinance as yf
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
+from src.compact_chain import CompactChain
+from src.config import CHAIN_MAX_WORKERS, CHAIN_CACHE_TTL_SECONDS
 
-def load_option_chain(ticker):
-    stock = yf.Ticker(ticker)
-    expiries = stock.options
 
-    all_options = []
+def fetch_option_chain(ticker, max_workers=CHAIN_MAX_WORKERS, stock=None):
+    """
+    Download every listed expiry of a ticker's chain, CHAIN_MAX_WORKERS
+    expiries at a time, as one frame with option_type/expiry/ticker
+    columns. `stock` may be any object with the yfinance Ticker
+    `options` / `option_chain(expiry)` interface.
+    """
+    if stock is None:
+        import yfinance as yf
+        stock = yf.Ticker(ticker)
+
+    expiries = list(stock.options)
+    if not expiries:
+        raise ValueError(f"No listed option expiries for {ticker}")
 
-    for expiry in expiries:
-        chain = stock.option_chain(expiry)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(expiries))) as pool:
+        chains = list(pool.map(stock.option_chain, expiries))
 
-        for opt_type, df in zip(["call", "put"], [chain.calls, chain.puts]):
-            df = df.copy()
-            df["option_type"] = opt_type
-            df["expiry"] = expiry
-            df["ticker"] = ticker
-            all_options.append(df)
+    frames = [df for chain in chains for df in (chain.calls, chain.puts)]
+    lengths = [len(df) for df in frames]
 
-    options_df = pd.concat(all_options, ignore_index=True)
+    # one concat, then the label columns as repeated arrays instead of
+    # copying every frame to tag it
+    options_df = pd.concat(frames, ignore_index=True)
+    options_df["option_type"] = np.repeat(["call", "put"] * len(expiries), lengths)
+    options_df["expiry"] = np.repeat(np.repeat(expiries, 2), lengths)
+    options_df["ticker"] = ticker
     return options_df
+
+
+class ChainCache:
+    """
+    Per-ticker chain snapshots kept for ttl_seconds. Concurrent callers
+    asking for the same ticker while it is being downloaded wait on that
+    one download instead of starting their own.
+
+    With compact=True snapshots are held only as exact CompactChains:
+    same values, rows and columns as fetched, with the string columns
+    coded and the contract symbols rebuilt on decode (about half the
+    DataFrame's memory). Each hit decodes, which costs milliseconds
+    rather than the frame copy of compact=False.
+    """
+
+    def __init__(self, fetch_fn=fetch_option_chain, ttl_seconds=CHAIN_CACHE_TTL_SECONDS, compact=True):
+        self.fetch_fn = fetch_fn
+        self.ttl_seconds = ttl_seconds
+        self.compact = compact
+        self._snapshots = {}
+        self._in_flight = {}
+        self._lock = threading.Lock()
+
+    def get(self, ticker):
+        with self._lock:
+            snapshot = self._snapshots.get(ticker)
+            fresh = snapshot is not None and time.monotonic() - snapshot[0] < self.ttl_seconds
+
+            future = self._in_flight.get(ticker)
+            owner = not fresh and future is None
+            if owner:
+                future = self._in_flight[ticker] = Future()
+
+        if fresh:
+            return self._expand(*snapshot[1:])
+        if not owner:
+            return self._expand(*future.result())
+
+        try:
+            options_df = self.fetch_fn(ticker)
+            stored = (self._store(options_df), pd.Timestamp.now())
+        except Exception as e:
+            with self._lock:
+                del self._in_flight[ticker]
+            future.set_exception(e)
+            raise
+
+        with self._lock:
+            self._snapshots[ticker] = (time.monotonic(), *stored)
+            del self._in_flight[ticker]
+        future.set_result(stored)
+
+        return self._expand(*stored)
+
+    def _store(self, options_df):
+        if self.compact:
+            try:
+                return CompactChain.from_frame(options_df, exact=True)
+            except ValueError:
+                pass  # e.g. strikes finer than the OCC 1/1000 grid
+        return options_df
+
+    def _expand(self, stored, snapshot_time):
+        options_df = stored.to_frame() if isinstance(stored, CompactChain) else stored.copy()
+        options_df.attrs["snapshot_time"] = snapshot_time
+        return options_df
+
+    def invalidate(self, ticker=None):
+        with self._lock:
+            if ticker is None:
+                self._snapshots.clear()
+            else:
+                self._snapshots.pop(ticker, None)
+
+
+_cache = ChainCache()
+
+
+def load_option_chain(ticker):
+    """The ticker's chain as fetched (values, row and column order), at most CHAIN_CACHE_TTL_SECONDS old."""
+    return _cache.get(ticker)
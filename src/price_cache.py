@@ -0,0 +1,180 @@
+import os
+import re
+import threading
+import time
+import warnings
+from abc import ABC, abstractmethod
+
+import numpy as np
+import pandas as pd
+from src.storage import load_frame, write_atomic
+
+BAR_COLUMNS = ["Open", "High", "Low", "Close", "Volume", "Dividends", "Stock Splits"]
+EVENT_COLUMNS = ["Dividends", "Stock Splits"]
+
+_PERIOD_UNITS = {"d": "days", "wk": "weeks", "mo": "months", "y": "years"}
+
+
+def _daily_index(index):
+    index = pd.DatetimeIndex(index)
+    if index.tz is not None:
+        index = index.tz_localize(None)
+    return index.normalize().rename("Date")
+
+
+def period_start(period, last_date):
+    """
+    First bar date for a yfinance-style period ("5d", "6mo", "1y", "ytd",
+    "max"), counted back from last_date. None means all history.
+    """
+    if period == "max":
+        return None
+    if period == "ytd":
+        return pd.Timestamp(last_date.year, 1, 1)
+
+    match = re.fullmatch(r"(\d+)(d|wk|mo|y)", period)
+    if match is None:
+        raise ValueError(f"Unknown period: {period}")
+
+    n, unit = match.groups()
+    return last_date - pd.DateOffset(**{_PERIOD_UNITS[unit]: int(n)})
+
+
+class PriceSource(ABC):
+    """Daily bar provider: history(ticker, start=None) -> frame of BAR_COLUMNS, oldest first."""
+
+    @abstractmethod
+    def history(self, ticker, start=None):
+        pass
+
+
+class YFinanceSource(PriceSource):
+
+    def history(self, ticker, start=None):
+        import yfinance as yf
+
+        stock = yf.Ticker(ticker)
+        if start is None:
+            return stock.history(period="max")
+        return stock.history(start=start.strftime("%Y-%m-%d"))
+
+
+class CsvSource(PriceSource):
+    """Offline stand-in that serves the data/raw/<ticker>_price files."""
+
+    def __init__(self, root="data/raw"):
+        self.root = root
+
+    def history(self, ticker, start=None):
+        # served from a migrated Parquet/Feather sibling when there is one
+        df = load_frame(os.path.join(self.root, f"{ticker.lower()}_price.csv"))
+
+        if start is not None:
+            df = df[df.index >= start]
+        return df
+
+
+class PriceCache:
+    """
+    Per-ticker daily bars kept as Parquet under root. The first request
+    for a ticker downloads its full history. After that only the tail
+    since the last stored bar is fetched (at most once per ttl_seconds)
+    and merged, and `returns` is computed for the new rows only. Every
+    period is sliced from the stored frame. Refreshes of one ticker are
+    serialized, so concurrent first loads download it once.
+
+    Sources may back-adjust the whole series after a split or dividend
+    (yfinance does). The tail fetch therefore starts at the last finished
+    stored bar. If that bar's close moved, or a split or dividend that is
+    not stored yet shows up, the cache is rebuilt from the full history.
+    """
+
+    def __init__(self, source=None, root="data/cache/prices", ttl_seconds=3600):
+        self.source = source or YFinanceSource()
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self._locks = {}
+
+    def _path(self, ticker):
+        return os.path.join(self.root, f"{ticker.lower()}.parquet")
+
+    def _fetch(self, ticker, start=None):
+        bars = self.source.history(ticker, start)
+        bars = bars[[c for c in BAR_COLUMNS if c in bars.columns]]
+        bars.index = _daily_index(bars.index)
+        return bars[~bars.index.duplicated(keep="last")].sort_index()
+
+    def _write(self, ticker, data):
+        write_atomic(self._path(ticker), data.to_parquet)
+
+    def refresh(self, ticker):
+        with self._locks.setdefault(ticker.lower(), threading.Lock()):
+            return self._refresh(ticker)
+
+    def _download(self, ticker):
+        data = self._fetch(ticker)
+        if data.empty:
+            raise ValueError(f"No price history for {ticker}")
+        data["returns"] = np.log(data["Close"] / data["Close"].shift(1))
+        self._write(ticker, data)
+        return data
+
+    @staticmethod
+    def _adjusted(cached, tail, anchor):
+        """True when the source has back-adjusted bars the cache already holds."""
+        if anchor not in tail.index or not np.isclose(tail.at[anchor, "Close"], cached.at[anchor, "Close"],
+                                                      rtol=1e-9, atol=0):
+            return True
+
+        events = [c for c in EVENT_COLUMNS if c in tail.columns and c in cached.columns]
+        stored = cached[events].reindex(tail.index).fillna(0)
+        return bool(tail[events].fillna(0).ne(stored).to_numpy().any())
+
+    def _refresh(self, ticker):
+        path = self._path(ticker)
+
+        if not os.path.exists(path):
+            return self._download(ticker)
+
+        cached = pd.read_parquet(path)
+        if time.time() - os.path.getmtime(path) < self.ttl_seconds:
+            return cached
+
+        # the newest stored bar may have been saved intraday, so the
+        # adjustment check anchors on the one before it
+        last = cached.index[-1]
+        anchor = cached.index[-2] if len(cached) > 1 else last
+        try:
+            tail = self._fetch(ticker, start=anchor)
+        except Exception as e:
+            warnings.warn(f"Price refresh for {ticker} failed ({e}); serving cached data")
+            return cached
+
+        tail = tail[tail.index >= anchor]
+        if tail.empty:
+            os.utime(path)
+            return cached
+        if self._adjusted(cached, tail, anchor):
+            return self._download(ticker)
+
+        tail = tail[tail.index >= last]
+        if tail.empty:
+            os.utime(path)
+            return cached
+
+        kept = cached[cached.index < tail.index[0]]
+        previous_close = kept["Close"].iloc[-1] if len(kept) else np.nan
+        closes = np.concatenate([[previous_close], tail["Close"].to_numpy()])
+        tail = tail.assign(returns=np.log(closes[1:] / closes[:-1]))
+
+        data = pd.concat([kept, tail])
+        self._write(ticker, data)
+        return data
+
+    def load(self, ticker, period="1y"):
+        data = self.refresh(ticker)
+        start = period_start(period, data.index[-1])
+
+        if start is not None:
+            data = data[data.index > start]
+        return data.dropna()
@@ -0,0 +1,53 @@
+import math
+from numbers import Real
+
+SQRT_2 = math.sqrt(2.0)
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def is_scalar(S, K, T, r, sigma):
+    """
+    True when the inputs can take the math-module fast path. Degenerate
+    inputs are left to the array path, which returns nan/inf instead of
+    raising.
+    """
+    if not all(isinstance(x, Real) for x in (S, K, T, r, sigma)):
+        return False
+
+    return S > 0 and K > 0 and T > 0 and sigma > 0
+
+
+def norm_cdf(x):
+    # erfc keeps full relative precision in the lower tail, like scipy's ndtr
+    return 0.5 * math.erfc(-x / SQRT_2)
+
+
+def norm_pdf(x):
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def price_scalar(S, K, T, r, sigma, option_type="call"):
+    """
+    Single-contract counterpart of src.batch_pricing.price_batch built on
+    the math module, avoiding NumPy/SciPy per-call overhead.
+    """
+    sign = 1.0 if option_type.lower() == "call" else -1.0
+
+    sqrt_t = math.sqrt(T)
+    vol_sqrt_t = sigma * sqrt_t
+    discount_k = K * math.exp(-r * T)
+
+    d1 = (math.log(S / K) + (r + 0.5 * sigma * sigma) * T) / vol_sqrt_t
+    d2 = d1 - vol_sqrt_t
+    pdf = norm_pdf(d1)
+    cdf1 = norm_cdf(sign * d1)
+    cdf2 = norm_cdf(sign * d2)
+
+    return {
+        "price": sign * (S * cdf1 - discount_k * cdf2),
+        "delta": sign * cdf1,
+        "gamma": pdf / (S * vol_sqrt_t),
+        "theta": -S * pdf * sigma / (2 * sqrt_t) - sign * r * discount_k * cdf2,
+        "vega": S * pdf * sqrt_t,
+        "rho": sign * discount_k * T * cdf2,
+    }
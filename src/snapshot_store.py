@@ -0,0 +1,159 @@
+import os
+import threading
+
+import numpy as np
+import pandas as pd
+from src.storage import write_atomic
+
+KEY = "contractSymbol"
+TRACKED_COLUMNS = ["bid", "ask", "lastPrice", "volume", "impliedVolatility"]
+
+
+def _changed(previous, current):
+    """Rows of current that are new, or whose tracked values differ from previous (NaN == NaN)."""
+    before = previous.reindex(current.index)
+    changed = ~before.index.isin(previous.index)
+
+    for col in TRACKED_COLUMNS:
+        a, b = before[col].to_numpy(dtype=float), current[col].to_numpy(dtype=float)
+        changed |= ~((a == b) | (np.isnan(a) & np.isnan(b)))
+
+    return changed
+
+
+class ChainSnapshotStore:
+    """
+    Intraday history of option chain snapshots, one directory per ticker.
+    A full base frame is written every base_every snapshots (or when more
+    than max_delta_fraction of the rows changed). In between, a snapshot
+    stores only the contracts whose bid/ask/lastPrice/volume/IV changed
+    or that were listed since, as full rows, plus a _deleted marker for
+    contracts that disappeared. Other columns are refreshed only when a
+    contract's row is written.
+
+        <root>/ticker=AAPL/20261017T153000-base.parquet
+        <root>/ticker=AAPL/20261017T153500-delta.parquet
+
+    Reconstructed chains are indexed and sorted by contractSymbol. Appends
+    for one ticker are serialized within the process.
+    """
+
+    def __init__(self, root="data/snapshots", base_every=12, max_delta_fraction=0.5):
+        self.root = root
+        self.base_every = base_every
+        self.max_delta_fraction = max_delta_fraction
+        self._latest = {}
+        self._locks = {}
+
+    def _ticker_dir(self, ticker):
+        return os.path.join(self.root, f"ticker={ticker}")
+
+    def _files(self, ticker):
+        """[(snapshot time, kind, path)] in time order."""
+        path = self._ticker_dir(ticker)
+        if not os.path.isdir(path):
+            return []
+
+        files = []
+        for name in sorted(os.listdir(path)):
+            if name.endswith(".parquet"):
+                stamp, kind = name[:-len(".parquet")].split("-")
+                files.append((pd.Timestamp(stamp), kind, os.path.join(path, name)))
+        return files
+
+    def append(self, options_df, snapshot_time=None):
+        """
+        Record one load_option_chain result (any number of tickers).
+        Defaults to the frame's attrs["snapshot_time"], else now.
+        Returns {ticker: (kind, rows written)}.
+        """
+        snapshot_time = snapshot_time or options_df.attrs.get("snapshot_time") or pd.Timestamp.now()
+        snapshot_time = pd.Timestamp(snapshot_time).floor("s")
+
+        written = {}
+        for ticker, chain in options_df.groupby("ticker", sort=False):
+            with self._locks.setdefault(ticker, threading.Lock()):
+                written[ticker] = self._append_ticker(ticker, chain, snapshot_time)
+        return written
+
+    def _append_ticker(self, ticker, chain, snapshot_time):
+        current = chain.drop_duplicates(KEY, keep="last").set_index(KEY).sort_index()
+        files = self._files(ticker)
+
+        if files and snapshot_time <= files[-1][0]:
+            raise ValueError(f"Snapshot {snapshot_time} is not after the last stored one for {ticker}")
+
+        since_base = len(files) - max((i for i, f in enumerate(files) if f[1] == "base"), default=-1)
+        previous = self._latest.get(ticker)
+        if previous is None and files:
+            previous = self.as_of(ticker, files[-1][0])
+
+        kind, rows = "base", current
+        if previous is not None and since_base < self.base_every:
+            changed = current[_changed(previous, current)]
+            deleted = previous.index.difference(current.index)
+
+            if len(changed) + len(deleted) <= self.max_delta_fraction * len(current):
+                kind = "delta"
+                removed = pd.DataFrame(index=deleted).assign(_deleted=True)
+                rows = pd.concat([changed.assign(_deleted=False), removed])
+
+        path = os.path.join(self._ticker_dir(ticker), f"{snapshot_time:%Y%m%dT%H%M%S}-{kind}.parquet")
+        write_atomic(path, lambda tmp_path: rows.reset_index().to_parquet(tmp_path, index=False))
+
+        self._latest[ticker] = current
+        return kind, len(rows)
+
+    @staticmethod
+    def _apply(state, delta):
+        delta = delta.set_index(KEY)
+        deleted = delta.pop("_deleted").to_numpy(dtype=bool)
+        # deletion markers leave NaNs in the file, so restore the base dtypes
+        # where the values fit; an int/bool column that now has real NaNs
+        # stays float (and the concat widens the state to match)
+        upserts = delta[~deleted]
+        casts = {}
+        for col, dtype in state.dtypes.items():
+            if col not in upserts or upserts[col].dtype == dtype:
+                continue
+            if dtype.kind in "iub" and upserts[col].isna().any():
+                continue
+            casts[col] = dtype
+        upserts = upserts.astype(casts)
+        state = state.drop(index=delta.index, errors="ignore")
+        return pd.concat([state, upserts]).sort_index()
+
+    def _replay(self, ticker, start=None, end=None):
+        files = self._files(ticker)
+        if end is not None:
+            files = [f for f in files if f[0] <= pd.Timestamp(end)]
+
+        first = 0
+        if start is not None:
+            # newest base at or before start
+            before = [i for i, f in enumerate(files) if f[1] == "base" and f[0] <= pd.Timestamp(start)]
+            first = before[-1] if before else 0
+
+        state = None
+        for when, kind, path in files[first:]:
+            frame = pd.read_parquet(path)
+            if kind == "base":
+                state = frame.set_index(KEY)
+            elif state is not None:
+                state = self._apply(state, frame)
+            else:
+                continue
+            yield when, state
+
+    def as_of(self, ticker, when):
+        """The chain as of the latest snapshot at or before `when`, or None."""
+        state = None
+        for _, state in self._replay(ticker, start=when, end=when):
+            pass
+        return state
+
+    def scan(self, ticker, start=None, end=None):
+        """Stream (snapshot time, chain) in time order between start and end inclusive."""
+        for when, state in self._replay(ticker, start, end):
+            if start is None or when >= pd.Timestamp(start):
+                yield when, state.copy()
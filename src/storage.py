@@ -0,0 +1,245 @@
+import errno
+import fnmatch
+import glob
+import json
+import os
+import shutil
+import tempfile
+
+import numpy as np
+import pandas as pd
+from src.feature_engineering import COLUMNS as OPTION_COLUMNS
+
+FORMATS = {".parquet": "parquet", ".feather": "feather", ".cols": "npy"}
+REPLACE_ATTEMPTS = 10  # swaps of a .cols directory lost to concurrent writers before giving up
+
+# float32 only where the column is never a key or a difference of close
+# values: Close feeds log returns and Strike is part of the contract key
+PRICE_SCHEMA = {
+    "index": "Date",
+    "columns": {
+        "Date": "date", "Open": "float32", "High": "float32", "Low": "float32", "Close": "float64",
+        "Volume": "int64", "Dividends": "float32", "Stock Splits": "float32", "returns": "float64",
+    },
+}
+
+OPTIONS_SCHEMA = {"columns": {c: "float32" for c in OPTION_COLUMNS}}
+
+GLOBAL_SCHEMA = {
+    "columns": {
+        "Ticker": "category", "Spot": "float32", "Strike": "float64", "T": "float32", "IV": "float32",
+        "Delta": "float32", "Theta": "float32", "Vega": "float32", "MarketPrice": "float32",
+        "Expiry": "datetime", "OptionType": "category", "Snapshot": "datetime",
+    },
+}
+
+SCHEMAS = [
+    ("*_price.*", PRICE_SCHEMA),
+    ("*options_dataset.*", OPTIONS_SCHEMA),
+    ("*global_options*", GLOBAL_SCHEMA),
+]
+
+
+def schema_for(path):
+    name = os.path.basename(path.rstrip("/"))
+    for pattern, schema in SCHEMAS:
+        if fnmatch.fnmatch(name, pattern):
+            return schema
+    return None
+
+
+def apply_schema(df, schema):
+    """Cast the columns a schema names; other columns are left alone."""
+    columns = {}
+    for col, kind in schema["columns"].items():
+        if col not in df.columns:
+            continue
+        if kind == "date":
+            # daily bars: keep the calendar date, drop any UTC offset
+            columns[col] = pd.to_datetime(df[col].astype(str).str[:10])
+        elif kind == "datetime":
+            columns[col] = pd.to_datetime(df[col])
+        else:
+            columns[col] = df[col].astype(kind)
+
+    return df.assign(**columns)
+
+
+def _format(path):
+    fmt = FORMATS.get(os.path.splitext(path.rstrip("/"))[1])
+    if fmt is None:
+        raise ValueError(f"Unknown storage format for {path}; use one of {list(FORMATS)}")
+    return fmt
+
+
+def write_atomic(path, write):
+    """
+    Call write(tmp_path) on a fresh temp file next to path, then rename it
+    over path, so readers see either the old file or the whole new one.
+    The temp file is removed if anything fails.
+    """
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    os.close(fd)
+    try:
+        write(tmp_path)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_atomic_dir(path, write):
+    """
+    write_atomic for a directory: write(tmp_dir) fills a fresh directory,
+    which then takes the place of path. A non-empty directory cannot be
+    replaced atomically, so the current copy is moved aside first, again
+    if another writer's copy lands in between (up to REPLACE_ATTEMPTS).
+    """
+    parent = os.path.dirname(path.rstrip("/")) or "."
+    os.makedirs(parent, exist_ok=True)
+
+    tmp_path = tempfile.mkdtemp(dir=parent, suffix=".tmp")
+    old_path = f"{tmp_path}.old"
+    try:
+        write(tmp_path)
+        for attempt in range(REPLACE_ATTEMPTS):
+            shutil.rmtree(old_path, ignore_errors=True)
+            try:
+                os.replace(path, old_path)
+            except FileNotFoundError:
+                pass
+            try:
+                os.replace(tmp_path, path)
+                break
+            except OSError as e:
+                if e.errno not in (errno.ENOTEMPTY, errno.EEXIST) or attempt == REPLACE_ATTEMPTS - 1:
+                    raise
+    except BaseException:
+        if os.path.isdir(old_path) and not os.path.exists(path):
+            os.replace(old_path, path)  # put the previous copy back
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        raise
+    finally:
+        shutil.rmtree(old_path, ignore_errors=True)
+
+
+def _save_npy(df, path):
+    def write(tmp_path):
+        meta = {"columns": list(df.columns), "categories": {}}
+        for i, col in enumerate(df.columns):
+            values = df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                meta["categories"][col] = values.cat.categories.tolist()
+                values = values.cat.codes
+            np.save(os.path.join(tmp_path, f"{i}.npy"), values.to_numpy())
+
+        with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+    write_atomic_dir(path, write)
+
+
+def _load_npy(path, columns=None, mmap=True):
+    with open(os.path.join(path, "meta.json")) as f:
+        meta = json.load(f)
+
+    data = {}
+    for i, col in enumerate(meta["columns"]):
+        if columns is not None and col not in columns:
+            continue
+        values = np.load(os.path.join(path, f"{i}.npy"), mmap_mode="r" if mmap else None)
+        if col in meta["categories"]:
+            values = pd.Categorical.from_codes(values, meta["categories"][col])
+        data[col] = values
+
+    return pd.DataFrame(data, copy=False)
+
+
+def save_frame(df, path, schema=None):
+    """
+    Write df as Parquet, Feather or a directory of .npy columns (".cols"),
+    picked by the extension of path. The schema (by default looked up
+    from the file name) is applied first, and a named index is stored as
+    a regular column.
+    """
+    schema = schema or schema_for(path) or {"columns": {}}
+    index = schema.get("index")
+    if index is not None and df.index.name == index:
+        df = df.reset_index()
+    df = apply_schema(df, schema)
+
+    fmt = _format(path)
+    if fmt == "npy":
+        _save_npy(df, path)
+        return
+
+    if fmt == "parquet":
+        write_atomic(path, lambda tmp_path: df.to_parquet(tmp_path, index=False))
+    else:
+        write_atomic(path, lambda tmp_path: df.reset_index(drop=True).to_feather(tmp_path))
+
+
+def load_frame(path, columns=None, schema=None, mmap=True):
+    """
+    Read a frame written by save_frame. A .csv path is served from a
+    migrated sibling (same stem, any stored format) when one exists,
+    otherwise parsed and typed with its schema.
+    """
+    schema = schema or schema_for(path) or {"columns": {}}
+
+    if path.endswith(".csv"):
+        stem = path[:-4]
+        migrated = [stem + ext for ext in FORMATS if os.path.exists(stem + ext)]
+        if not migrated:
+            return _read_csv(path, columns, schema)
+        path = migrated[0]
+
+    fmt = _format(path)
+    if fmt == "parquet":
+        df = pd.read_parquet(path, columns=columns)
+    elif fmt == "feather":
+        df = pd.read_feather(path, columns=columns)
+    else:
+        df = _load_npy(path, columns, mmap)
+
+    return _restore_index(df, schema)
+
+
+def _read_csv(path, columns, schema):
+    return _restore_index(apply_schema(pd.read_csv(path, usecols=columns), schema), schema)
+
+
+def _restore_index(df, schema):
+    index = schema.get("index")
+    if index is not None and index in df.columns:
+        df = df.set_index(index)
+    return df
+
+
+def migrate_csvs(patterns=("data/raw/*.csv", "data/processed/*.csv"), ext=".parquet", remove=False):
+    """
+    One-shot conversion of the CSV artifacts to ext next to the originals.
+    Returns a report of the sizes before and after.
+    """
+    rows = []
+    for csv_path in sorted(p for pattern in patterns for p in glob.glob(pattern)):
+        target = csv_path[:-4] + ext
+        schema = schema_for(csv_path) or {"columns": {}}
+        save_frame(_read_csv(csv_path, None, schema), target, schema)
+
+        rows.append({"csv": csv_path, "target": target, "csv_bytes": os.path.getsize(csv_path),
+                     "bytes": _size(target)})
+        if remove:
+            os.remove(csv_path)
+
+    return pd.DataFrame(rows)
+
+
+def _size(path):
+    if os.path.isdir(path):
+        return sum(os.path.getsize(os.path.join(path, name)) for name in os.listdir(path))
+    return os.path.getsize(path)
@@ -0,0 +1,212 @@
+import json
+import os
+
+import numpy as np
+from sklearn.ensemble import (
+    ExtraTreesRegressor, GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+)
+from src.storage import write_atomic_dir
+
+ARRAYS = (
+    "feature", "threshold", "left", "right", "value", "missing_left", "bitset_idx", "bitsets", "roots",
+    "column_order", "categories", "category_offsets",
+)
+
+
+def _sklearn_tree_nodes(tree):
+    t = tree.tree_
+    leaf = t.children_left < 0
+    missing_left = getattr(t, "missing_go_to_left", np.zeros(t.node_count, dtype=np.uint8))
+
+    return {
+        "feature": np.where(leaf, 0, t.feature),
+        "threshold": t.threshold,
+        "left": t.children_left,
+        "right": t.children_right,
+        "value": t.value[:, 0, 0],
+        "missing_left": missing_left.astype(bool),
+        "bitset_idx": np.full(t.node_count, -1),
+        "leaf": leaf,
+    }, np.empty((0, 8), dtype=np.uint32), t.max_depth
+
+
+def _hist_predictor_nodes(predictor):
+    nodes = predictor.nodes
+    leaf = nodes["is_leaf"].astype(bool)
+    categorical = nodes["is_categorical"].astype(bool) & ~leaf
+
+    return {
+        "feature": nodes["feature_idx"],
+        "threshold": nodes["num_threshold"],
+        "left": nodes["left"],
+        "right": nodes["right"],
+        "value": nodes["value"],
+        "missing_left": nodes["missing_go_to_left"].astype(bool),
+        "bitset_idx": np.where(categorical, nodes["bitset_idx"].astype(np.int64), -1),
+        "leaf": leaf,
+    }, predictor.raw_left_cat_bitsets, int(nodes["depth"].max())
+
+
+def _input_mapping(estimator):
+    """
+    Column order and per-column category lists applied before the trees.
+    HistGradientBoosting with categorical features reorders columns
+    (categoricals first) and ordinal-encodes them internally.
+    """
+    preprocessor = getattr(estimator, "_preprocessor", None)
+    if preprocessor is None:
+        return np.arange(estimator.n_features_in_), []
+
+    masks = dict((name, mask) for name, _, mask in preprocessor.transformers_)
+    order = np.concatenate([np.flatnonzero(masks["encoder"]), np.flatnonzero(masks["numerical"])])
+    return order, preprocessor.named_transformers_["encoder"].categories_
+
+
+def _ensemble_trees(estimator):
+    """(per-tree node dicts, base, scale, float32_inputs) for a fitted sklearn regressor."""
+    if isinstance(estimator, (RandomForestRegressor, ExtraTreesRegressor)):
+        trees = [_sklearn_tree_nodes(t) for t in estimator.estimators_]
+        return trees, 0.0, 1.0 / len(trees), True
+
+    if isinstance(estimator, GradientBoostingRegressor):
+        trees = [_sklearn_tree_nodes(t) for t in estimator.estimators_[:, 0]]
+        if estimator.init_ == "zero":
+            base = 0.0
+        else:
+            base = float(estimator.init_.predict(np.zeros((1, estimator.n_features_in_)))[0])
+        return trees, base, estimator.learning_rate, True
+
+    if isinstance(estimator, HistGradientBoostingRegressor):
+        if type(estimator._loss.link).__name__ != "IdentityLink":
+            raise ValueError("Only identity-link HistGradientBoosting losses can be flattened")
+        trees = [_hist_predictor_nodes(p[0]) for p in estimator._predictors]
+        return trees, float(np.ravel(estimator._baseline_prediction)[0]), 1.0, False
+
+    raise TypeError(f"Cannot flatten {type(estimator).__name__}")
+
+
+class FlatEnsemble:
+    """
+    A fitted tree ensemble as contiguous node arrays (feature, threshold,
+    children, leaf value) with all trees concatenated. Leaves point at
+    themselves, so every tree is walked for a fixed number of levels for a
+    whole batch of rows at once.
+
+    For a Pipeline, flatten its final step and apply pipeline[:-1].transform
+    to the inputs first.
+    """
+
+    def __init__(self, arrays, base, scale, depth, float32_inputs):
+        self.arrays = arrays
+        self.base = base
+        self.scale = scale
+        self.depth = depth
+        self.float32_inputs = float32_inputs
+
+    @classmethod
+    def from_sklearn(cls, estimator):
+        trees, base, scale, float32_inputs = _ensemble_trees(estimator)
+
+        parts = {name: [] for name in ARRAYS[:7]}
+        roots, bitsets = [], []
+        node_offset, bitset_offset, depth = 0, 0, 0
+
+        for nodes, tree_bitsets, tree_depth in trees:
+            n = len(nodes["value"])
+            own = np.arange(node_offset, node_offset + n)
+
+            parts["feature"].append(nodes["feature"])
+            parts["threshold"].append(nodes["threshold"])
+            parts["left"].append(np.where(nodes["leaf"], own, nodes["left"] + node_offset))
+            parts["right"].append(np.where(nodes["leaf"], own, nodes["right"] + node_offset))
+            parts["value"].append(nodes["value"])
+            parts["missing_left"].append(nodes["missing_left"])
+            parts["bitset_idx"].append(np.where(nodes["bitset_idx"] >= 0, nodes["bitset_idx"] + bitset_offset, -1))
+
+            roots.append(node_offset)
+            bitsets.append(tree_bitsets)
+            node_offset += n
+            bitset_offset += len(tree_bitsets)
+            depth = max(depth, tree_depth)
+
+        dtypes = {
+            "feature": np.int32, "threshold": np.float64, "left": np.int32, "right": np.int32,
+            "value": np.float64, "missing_left": bool, "bitset_idx": np.int32,
+        }
+        arrays = {name: np.ascontiguousarray(np.concatenate(parts[name]), dtype=dtypes[name]) for name in parts}
+        arrays["bitsets"] = np.ascontiguousarray(np.concatenate(bitsets), dtype=np.uint32)
+        arrays["roots"] = np.asarray(roots, dtype=np.int32)
+
+        column_order, categories = _input_mapping(estimator)
+        arrays["column_order"] = np.asarray(column_order, dtype=np.int32)
+        arrays["categories"] = np.concatenate([np.empty(0)] + [np.asarray(c, dtype=np.float64) for c in categories])
+        arrays["category_offsets"] = np.cumsum([0] + [len(c) for c in categories]).astype(np.int32)
+
+        return cls(arrays, base, scale, depth, float32_inputs)
+
+    def save(self, path):
+        def write(tmp_path):
+            for name in ARRAYS:
+                np.save(os.path.join(tmp_path, f"{name}.npy"), self.arrays[name])
+
+            meta = {"base": self.base, "scale": self.scale, "depth": self.depth,
+                    "float32_inputs": self.float32_inputs}
+            with open(os.path.join(tmp_path, "meta.json"), "w") as f:
+                json.dump(meta, f, indent=2)
+
+        # readers mapping the arrays never see a half-written ensemble
+        write_atomic_dir(path, write)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        with open(os.path.join(path, "meta.json")) as f:
+            meta = json.load(f)
+
+        arrays = {
+            name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode="r" if mmap else None)
+            for name in ARRAYS
+        }
+        return cls(arrays, **meta)
+
+    def predict(self, X, chunk_size=4096):
+        # sklearn's own trees compare float32 inputs; histogram GBMs use float64
+        a = self.arrays
+        X = np.asarray(X, dtype=np.float64)[:, a["column_order"]]
+
+        offsets = a["category_offsets"]
+        for j in range(len(offsets) - 1):
+            known = a["categories"][offsets[j] : offsets[j + 1]]
+            code = np.minimum(np.searchsorted(known, X[:, j]), len(known) - 1)
+            X[:, j] = np.where(known[code] == X[:, j], code, np.nan)
+
+        X = X.astype(np.float32 if self.float32_inputs else np.float64)
+        has_categorical = len(a["bitsets"]) > 0
+        out = np.empty(len(X))
+
+        for start in range(0, len(X), chunk_size):
+            rows = X[start : start + chunk_size]
+            row_idx = np.arange(len(rows))[:, None]
+            nodes = np.broadcast_to(a["roots"], (len(rows), len(a["roots"])))
+
+            for _ in range(self.depth):
+                x = rows[row_idx, a["feature"][nodes]]
+                go_left = x <= a["threshold"][nodes]
+
+                missing = np.isnan(x)
+                if missing.any():
+                    go_left = np.where(missing, a["missing_left"][nodes], go_left)
+
+                if has_categorical:
+                    bitset = a["bitset_idx"][nodes]
+                    categorical = (bitset >= 0) & ~missing
+                    if categorical.any():
+                        category = np.where(categorical, x, 0).astype(np.int64) & 255
+                        word = a["bitsets"][np.maximum(bitset, 0), category >> 5]
+                        in_left = ((word >> (category & 31).astype(np.uint32)) & 1).astype(bool)
+                        go_left = np.where(categorical, in_left, go_left)
+
+                nodes = np.where(go_left, a["left"][nodes], a["right"][nodes])
+
+            out[start : start + len(rows)] = self.base + self.scale * a["value"][nodes].sum(axis=1)
+
+        return out
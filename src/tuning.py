@@ -0,0 +1,197 @@
+import hashlib
+import itertools
+import math
+import os
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+from sklearn.compose import ColumnTransformer
+from sklearn.ensemble import GradientBoostingRegressor, HistGradientBoostingRegressor, RandomForestRegressor
+from sklearn.metrics import mean_absolute_error
+from sklearn.model_selection import TimeSeriesSplit
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from src.config import RANDOM_STATE
+
+MODELS = {
+    "rf": lambda n_estimators, max_depth: RandomForestRegressor(
+        n_estimators=n_estimators, max_depth=max_depth, random_state=RANDOM_STATE
+    ),
+    "gbr": lambda n_estimators, max_depth: GradientBoostingRegressor(
+        n_estimators=n_estimators, max_depth=max_depth, learning_rate=0.05, random_state=RANDOM_STATE
+    ),
+    "hist": lambda n_estimators, max_depth: HistGradientBoostingRegressor(
+        max_iter=n_estimators, max_depth=max_depth, early_stopping=False, random_state=RANDOM_STATE
+    ),
+}
+
+DEFAULT_GRID = {"n_estimators": (50, 100, 300), "max_depth": (4, 6, 10, None)}
+
+FOLD_CACHE_ENTRIES = 2  # fitted fold sets kept, each several copies of the frame
+
+_fold_cache = OrderedDict()
+_worker_folds = None
+
+
+def _time_order(df, time_column):
+    if time_column in df.columns:
+        return np.argsort(df[time_column].to_numpy(), kind="stable")
+    return np.arange(len(df))
+
+
+def _fit_fold(df, train_idx, val_idx, target):
+    X = df.drop(target, axis=1)
+    categorical = [c for c in ("Ticker", "OptionType") if c in X.columns]
+    numerical = [c for c in X.select_dtypes("number").columns if c not in categorical]
+
+    preprocessor = ColumnTransformer([
+        ("cat", OneHotEncoder(handle_unknown="ignore", sparse_output=False), categorical),
+        ("num", StandardScaler(), numerical)
+    ])
+
+    X_train = preprocessor.fit_transform(X.iloc[train_idx])
+    X_val = preprocessor.transform(X.iloc[val_idx])
+    y = df[target].to_numpy()
+
+    return X_train, y[train_idx], X_val, y[val_idx]
+
+
+def time_folds(df, n_splits=5, time_column="Snapshot", target="MarketPrice"):
+    """
+    Expanding-window folds in time order (row order when there is no
+    time_column), each validated on the block that follows its training
+    window. The scaler/encoder is fitted on the training block only.
+
+    Fitted folds of the FOLD_CACHE_ENTRIES most recent frames are
+    cached, so tuning several models on one frame reuses the same
+    transformed arrays.
+    """
+    h = hashlib.sha256(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    key = (h.hexdigest(), n_splits, time_column, target)
+
+    if key in _fold_cache:
+        _fold_cache.move_to_end(key)
+        return _fold_cache[key]
+
+    order = _time_order(df, time_column)
+    features = df.drop(columns=[c for c in df.columns if c == time_column or
+                                pd.api.types.is_datetime64_any_dtype(df[c])])
+
+    folds = _fold_cache[key] = [
+        _fit_fold(features, order[train_idx], order[val_idx], target)
+        for train_idx, val_idx in TimeSeriesSplit(n_splits=n_splits).split(order)
+    ]
+    while len(_fold_cache) > FOLD_CACHE_ENTRIES:
+        _fold_cache.popitem(last=False)
+    return folds
+
+
+def _init_worker(folds):
+    global _worker_folds
+    _worker_folds = folds
+
+
+def _evaluate(task):
+    model_name, params, fold = task
+    X_train, y_train, X_val, y_val = _worker_folds[fold]
+    model = MODELS[model_name](**params)
+
+    start = time.perf_counter()
+    model.fit(X_train, y_train)
+    fit_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    preds = model.predict(X_val)
+    batch_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(3):
+        model.predict(X_val[:1])
+    row_s = (time.perf_counter() - start) / 3
+
+    return mean_absolute_error(y_val, preds), fit_s, batch_s / len(X_val), row_s
+
+
+def _grid(grid):
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*grid.values())]
+
+
+def successive_halving(df, model="rf", grid=None, n_splits=5, eta=3, workers=None,
+                       time_column="Snapshot", target="MarketPrice"):
+    """
+    Tune n_estimators/max_depth for one of MODELS on time-aware CV folds.
+
+    Every configuration starts on the most recent fold. After each rung
+    only the best 1/eta by mean MAE go on, evaluated on eta times as many
+    folds (already-scored folds are not refitted) until the survivors
+    have seen all n_splits. Fits run in a process pool.
+
+    Returns a leaderboard with one row per configuration, sorted by how
+    far it got and then by MAE.
+    """
+    if model not in MODELS:
+        raise ValueError(f"Unknown model: {model}")
+
+    folds = time_folds(df, n_splits, time_column, target)
+    configs = _grid(grid or DEFAULT_GRID)
+    workers = workers or os.cpu_count()
+    scores, reached = {}, {}
+
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(folds,)) if workers > 1 else None
+    _init_worker(folds)
+
+    try:
+        survivors = list(range(len(configs)))
+        n_folds, rung = 1, 0
+
+        while True:
+            n_folds = min(n_folds, n_splits)
+            used = range(n_splits - n_folds, n_splits)
+
+            tasks = [(c, f) for c in survivors for f in used if (c, f) not in scores]
+            work = [(model, configs[c], f) for c, f in tasks]
+            results = pool.map(_evaluate, work) if pool else map(_evaluate, work)
+            scores.update(zip(tasks, results))
+
+            reached.update(dict.fromkeys(survivors, rung))
+
+            if n_folds == n_splits or len(survivors) <= 1:
+                break
+
+            survivors.sort(key=lambda c: np.mean([scores[c, f][0] for f in used]))
+            survivors = survivors[:math.ceil(len(survivors) / eta)]
+            n_folds *= eta
+            rung += 1
+    finally:
+        if pool:
+            pool.shutdown()
+
+    rows = []
+    for c, config in enumerate(configs):
+        results = np.array([scores[key] for key in scores if key[0] == c])
+        rows.append({
+            "model": model,
+            # as a label, so max_depth=None doesn't turn the column into NaN floats
+            **{name: "None" if value is None else value for name, value in config.items()},
+            "rung": reached[c],
+            "folds": len(results),
+            "mae": results[:, 0].mean(),
+            "mae_std": results[:, 0].std(),
+            "fit_s": results[:, 1].mean(),
+            "predict_us_per_row": results[:, 2].mean() * 1e6,
+            "predict_one_ms": results[:, 3].mean() * 1e3,
+        })
+
+    leaderboard = pd.DataFrame(rows)
+    return leaderboard.sort_values(["rung", "mae"], ascending=[False, True], ignore_index=True)
+
+
+def cheapest_within(leaderboard, max_mae, latency="predict_one_ms"):
+    """Fastest fully evaluated configuration whose CV MAE meets the error budget, or None."""
+    finished = leaderboard[(leaderboard["rung"] == leaderboard["rung"].max()) & (leaderboard["mae"] <= max_mae)]
+    if finished.empty:
+        return None
+    return finished.sort_values(latency).iloc[0]
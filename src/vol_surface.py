@@ -1,12 +1,18 @@
+from collections import OrderedDict
+
 import numpy as np
 import pandas as pd
+from scipy.optimize import minimize
+
+SVI_PARAMS = ["a", "b", "rho", "m", "sigma"]
+
 
-def approximate_vol_surface(option_df):
+def approximate_vol_surface(option_df, spot):
     """
-    Returns implied vol as function of moneyness & maturity
+    Returns implied vol as function of moneyness (strike / spot) & maturity
     """
     option_df = option_df.copy()
-    option_df["moneyness"] = option_df["strike"] / option_df["lastPrice"]
+    option_df["moneyness"] = option_df["strike"] / spot
 
     surface = (
         option_df
@@ -15,3 +21,298 @@ def approximate_vol_surface(option_df):
     )
 
     return surface
+
+
+def svi_total_variance(params, k):
+    """Raw SVI w(k) = a + b * (rho * (k - m) + sqrt((k - m)^2 + sigma^2)); params (..., 5)."""
+    a, b, rho, m, sigma = np.moveaxis(np.asarray(params), -1, 0)
+    x = k - m
+    return a + b * (rho * x + np.sqrt(x * x + sigma * sigma))
+
+
+def _inner_fit(k, w, m, sigma):
+    """
+    Quasi-explicit step: for fixed (m, sigma) a slice is linear in
+    (a, d, c) = (a, rho*b*sigma, b*sigma), so every candidate pair is
+    solved at once as stacked 3x3 normal equations. Candidates that
+    break the raw-SVI constraints get an infinite error.
+    """
+    y = (k[None, :] - m[:, None]) / sigma[:, None]
+    X = np.stack([np.ones_like(y), y, np.sqrt(y * y + 1)], axis=-1)
+    Xt = X.transpose(0, 2, 1)
+
+    coef = np.linalg.solve(Xt @ X + 1e-12 * np.eye(3), (Xt @ w)[..., None])[..., 0]
+    a, d, c = coef.T
+    sse = np.sum((np.einsum("gnj,gj->gn", X, coef) - w) ** 2, axis=-1)
+
+    valid = (c > 0) & (np.abs(d) <= c) & (a + np.sqrt(np.maximum(c * c - d * d, 0)) >= 0)
+    sse = np.where(valid, sse, np.inf)
+
+    params = np.stack([a, c / sigma, d / np.where(c > 0, c, 1.0), m, sigma], axis=-1)
+    return params, sse
+
+
+def fit_svi_slice(k, w, grid_size=24, initial=None):
+    """
+    Raw-SVI parameters for one expiry from log-moneyness k and total
+    variance w: a vectorized grid over (m, sigma), then Nelder-Mead on
+    the best pair with the linear part re-solved exactly at each step.
+    With `initial` (previous params for the slice) the grid is skipped
+    and Nelder-Mead starts from its (m, sigma).
+    Returns (params, rmse).
+    """
+    k, w = np.asarray(k, dtype=float), np.asarray(w, dtype=float)
+
+    def objective(x):
+        return _inner_fit(k, w, x[:1], np.exp(x[1:]))[1][0]
+
+    sse = np.array([np.inf])
+    if initial is not None and initial[4] > 0:
+        params, sse = _inner_fit(k, w, np.array([initial[3]]), np.array([initial[4]]))
+
+    if not np.isfinite(sse).any():
+        span = max(np.ptp(k), 0.05)
+        m_grid, s_grid = np.meshgrid(
+            np.linspace(k.min(), k.max(), grid_size), np.geomspace(0.01 * span, 2 * span, grid_size)
+        )
+        params, sse = _inner_fit(k, w, m_grid.ravel(), s_grid.ravel())
+
+    if not np.isfinite(sse).any():
+        # no admissible smile: flat total variance
+        return np.array([w.mean(), 0.0, 0.0, 0.0, 0.1]), float(np.std(w))
+
+    best = params[np.argmin(sse)]
+    result = minimize(objective, x0=[best[3], np.log(best[4])], method="Nelder-Mead",
+                      options={"xatol": 1e-6, "fatol": 1e-12})
+
+    if result.fun < sse.min():
+        best = _inner_fit(k, w, result.x[:1], np.exp(result.x[1:]))[0][0]
+
+    rmse = np.sqrt(np.mean((svi_total_variance(best, k) - w) ** 2))
+    return best, float(rmse)
+
+
+class SVISurface:
+    """
+    Raw-SVI slice per expiry, with total variance interpolated linearly in
+    T at fixed log-forward-moneyness between slices and held at the
+    nearest slice's implied vol outside them.
+
+    The surface keeps the quotes behind each slice. update_quotes() marks
+    the expiries whose quotes changed, and refit() refits only those,
+    warm-started from their previous parameters, writing the results
+    into the term-structure arrays. `refits` counts updates and slices
+    refit.
+    """
+
+    def __init__(self, T, params, spot, r, rmse=None, expiries=None, min_points=5):
+        order = np.argsort(T)
+        self.T = np.asarray(T, dtype=float)[order]
+        self.params = np.asarray(params, dtype=float).reshape(-1, 5)[order]
+        self.spot = spot
+        self.r = r
+        self.rmse = np.full(len(self.T), np.nan) if rmse is None else np.asarray(rmse, dtype=float)[order]
+        self.expiries = np.full(len(self.T), None) if expiries is None else np.asarray(expiries, dtype=object)[order]
+        self.min_points = min_points
+
+        self.as_of = None
+        self._quotes = {}  # expiry -> IV Series indexed by strike
+        self._dirty = set()
+        self.refits = {"updates": 0, "last": 0, "total": 0}
+
+    @classmethod
+    def fit(cls, chain, spot, r, as_of=None, min_points=5):
+        """
+        Fit from a load_option_chain frame (or chain_implied_vol output,
+        whose `iv` column is preferred). Only out-of-the-money quotes with
+        a usable IV are used.
+        """
+        surface = cls(np.empty(0), np.empty((0, 5)), spot, r, min_points=min_points)
+        surface.update_quotes(chain, as_of=as_of)
+        surface.refit()
+
+        if not len(surface.T):
+            raise ValueError(f"No expiry has {min_points} usable out-of-the-money quotes")
+        return surface
+
+    def copy(self):
+        surface = SVISurface(self.T, self.params, self.spot, self.r, self.rmse, self.expiries, self.min_points)
+        surface.as_of = self.as_of
+        surface._quotes = dict(self._quotes)
+        surface._dirty = set(self._dirty)
+        surface.refits = dict(self.refits)
+        return surface
+
+    def _maturity(self, expiry):
+        return max((pd.Timestamp(expiry) - self.as_of).days / 365, 1 / 365)
+
+    def update_quotes(self, chain, spot=None, as_of=None, replace=False):
+        """
+        Merge new quotes (just the changed rows) into the stored slices, or
+        with replace=True take `chain` as the full snapshot: each slice's
+        quotes are replaced and expiries missing from it are dropped.
+        Either way expired slices are dropped and only the expiries that
+        actually changed are marked. A new spot or as-of date changes
+        every slice's moneyness or maturity, so it marks them all.
+        Returns the set of dirty expiries.
+        """
+        as_of = chain.attrs.get("snapshot_time") if as_of is None else as_of
+        as_of = (pd.Timestamp.today() if as_of is None else pd.Timestamp(as_of)).normalize()
+
+        if as_of != self.as_of or (spot is not None and spot != self.spot):
+            self.as_of = as_of
+            self.spot = self.spot if spot is None else spot
+            self._dirty.update(self._quotes)
+
+        iv = chain["iv"] if "iv" in chain.columns else chain["impliedVolatility"]
+        iv = iv.to_numpy(dtype=float)
+        K = chain["strike"].to_numpy(dtype=float)
+        expiry = pd.to_datetime(chain["expiry"])
+        days = (expiry - as_of).dt.days.to_numpy()
+        T = np.maximum(days / 365, 1 / 365)
+
+        k = np.log(K / (self.spot * np.exp(self.r * T)))
+        is_call = chain["option_type"].str.lower().to_numpy() == "call"
+        otm = is_call == (k >= 0)
+        usable = np.isfinite(iv) & (iv > 0.01) & (iv < 5) & (days > 0)
+
+        labels = chain["expiry"].to_numpy()
+        seen = np.unique(labels[otm])
+        for label in seen:
+            rows = otm & (labels == label)
+            fresh = pd.Series(iv[rows & usable], index=K[rows & usable])
+            fresh = fresh[~fresh.index.duplicated(keep="last")]
+
+            old = self._quotes.get(label)
+            if old is None or replace:
+                merged = fresh.sort_index()
+            else:
+                # an unusable new quote retires the strike's old one
+                merged = fresh.combine_first(old.drop(K[rows & ~usable], errors="ignore"))
+
+            if old is None or not merged.equals(old):
+                self._quotes[label] = merged
+                self._dirty.add(label)
+
+        for label in list(self._quotes):
+            if (replace and label not in seen) or pd.Timestamp(label) <= as_of:
+                del self._quotes[label]
+                self._dirty.add(label)
+
+        return set(self._dirty)
+
+    def refit(self):
+        """Refit the dirty slices; returns how many were refit."""
+        slices = {e: (T, p, err) for e, T, p, err in zip(self.expiries, self.T, self.params, self.rmse)}
+        refit = 0
+
+        for label in sorted(self._dirty):
+            quotes = self._quotes.get(label)
+            if quotes is None or len(quotes) < self.min_points:
+                slices.pop(label, None)
+                continue
+
+            T = self._maturity(label)
+            k = np.log(quotes.index.to_numpy() / (self.spot * np.exp(self.r * T)))
+            previous = slices.get(label)
+            params, error = fit_svi_slice(k, quotes.to_numpy() ** 2 * T,
+                                          initial=None if previous is None else previous[1])
+            slices[label] = (T, params, error)
+            refit += 1
+
+        self._dirty.clear()
+
+        if list(slices) == list(self.expiries):
+            # same expiries: write the refit slices into the existing arrays
+            for i, label in enumerate(self.expiries):
+                self.T[i], self.params[i], self.rmse[i] = slices[label]
+        else:
+            labels = sorted(slices, key=lambda e: slices[e][0])
+            self.expiries = np.array(labels, dtype=object)
+            self.T = np.array([slices[e][0] for e in labels], dtype=float)
+            self.params = np.array([slices[e][1] for e in labels], dtype=float).reshape(-1, 5)
+            self.rmse = np.array([slices[e][2] for e in labels], dtype=float)
+
+        self.refits["updates"] += 1
+        self.refits["last"] = refit
+        self.refits["total"] += refit
+        return refit
+
+    def total_variance(self, K, T):
+        K, T = np.broadcast_arrays(np.asarray(K, dtype=float), np.asarray(T, dtype=float))
+        k = np.log(K / (self.spot * np.exp(self.r * T)))
+
+        hi = np.clip(np.searchsorted(self.T, T), 1, len(self.T) - 1) if len(self.T) > 1 else np.zeros(T.shape, int)
+        lo = np.maximum(hi - 1, 0)
+        T_lo, T_hi = self.T[lo], self.T[hi]
+
+        w_lo = svi_total_variance(self.params[lo], k)
+        w_hi = svi_total_variance(self.params[hi], k)
+
+        weight = np.where(T_hi > T_lo, (T - T_lo) / np.where(T_hi > T_lo, T_hi - T_lo, 1.0), 0.0)
+        w = w_lo + np.clip(weight, 0.0, 1.0) * (w_hi - w_lo)
+
+        # outside the fitted range keep the edge slice's implied vol
+        w = np.where(T < self.T[0], w_lo * T / self.T[0], w)
+        w = np.where(T > self.T[-1], w_hi * T / self.T[-1], w)
+        return w
+
+    def iv(self, K, T):
+        """Implied vol at strikes K and maturities T (years); arrays broadcast."""
+        T = np.asarray(T, dtype=float)
+        return np.sqrt(np.maximum(self.total_variance(K, T), 0.0) / T)
+
+    def params_frame(self):
+        df = pd.DataFrame(self.params, columns=SVI_PARAMS)
+        df.insert(0, "T", self.T)
+        if self.expiries is not None:
+            df.insert(0, "expiry", self.expiries)
+        if self.rmse is not None:
+            df["rmse"] = self.rmse
+        return df
+
+
+class SurfaceCache:
+    """
+    Fitted surfaces keyed by (ticker, snapshot time), least recently used
+    evicted. A new snapshot of a ticker starts from that ticker's latest
+    surface and refits only the slices whose quotes changed.
+    """
+
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self._surfaces = OrderedDict()
+        self._latest = {}
+
+    def get(self, chain, spot, r):
+        snapshot = chain.attrs.get("snapshot_time")
+        if snapshot is None:
+            return SVISurface.fit(chain, spot, r)
+
+        key = (chain["ticker"].iloc[0], snapshot, spot, r)
+        if key in self._surfaces:
+            self._surfaces.move_to_end(key)
+            return self._surfaces[key]
+
+        previous = self._latest.get((key[0], r))
+        if previous is None:
+            surface = SVISurface.fit(chain, spot, r)
+        else:
+            # a newer snapshot of a fitted ticker: refit only what changed
+            surface = previous.copy()
+            surface.update_quotes(chain, spot=spot, replace=True)
+            surface.refit()
+
+        self._surfaces[key] = surface
+        self._latest[(key[0], r)] = surface
+        while len(self._surfaces) > self.max_entries:
+            self._surfaces.popitem(last=False)
+        return surface
+
+
+_cache = SurfaceCache()
+
+
+def svi_surface(chain, spot, r):
+    """Fitted SVI surface for a chain snapshot, reused while the snapshot is unchanged."""
+    return _cache.get(chain, spot, r)
@@ -1,5 +1,193 @@
+from collections import deque
+
 import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+from scipy.signal import lfilter
 from src.config import TRADING_DAYS
 
+EWMA_LAMBDA = 0.94  # RiskMetrics daily decay
+
+# Series estimators below take a Series (one ticker) or a DataFrame of
+# returns with one column per ticker and return the same shape. The value
+# at bar t is the annualized volatility forecast for the next bar, using
+# returns up to and including t.
+
+
 def historical_volatility(returns):
     return returns.std() * np.sqrt(TRADING_DAYS)
+
+
+def _as_frame(returns):
+    return returns.to_frame() if isinstance(returns, pd.Series) else returns
+
+
+def _like(values, returns):
+    frame = _as_frame(returns)
+    out = pd.DataFrame(values, index=frame.index, columns=frame.columns)
+    return out.iloc[:, 0].rename(returns.name) if isinstance(returns, pd.Series) else out
+
+
+def rolling_volatility(returns, window=21):
+    return returns.rolling(window, min_periods=window).std() * np.sqrt(TRADING_DAYS)
+
+
+def ewma_volatility(returns, lam=EWMA_LAMBDA):
+    # sigma2_t = lam * sigma2_{t-1} + (1 - lam) * r_t^2, seeded with the first r^2
+    variance = (returns**2).ewm(alpha=1 - lam, adjust=False).mean()
+    return np.sqrt(variance * TRADING_DAYS)
+
+
+def _garch_variance(r, omega, alpha, beta, initial):
+    # sigma2_t = omega + alpha * r_t^2 + beta * sigma2_{t-1} as one IIR filter
+    # pass over r^2 plus the constant omega / (1 - beta)
+    level = omega / (1 - beta)
+    filtered, _ = lfilter([alpha], [1.0, -beta], r**2, zi=[beta * (initial - level)])
+    return filtered + level
+
+
+def _garch_nll(params, r, variance):
+    alpha, beta = params
+    if alpha <= 0 or beta <= 0 or alpha + beta >= 0.9999:
+        return np.inf
+
+    omega = variance * (1 - alpha - beta)
+    # r_t is scored against the forecast made after bar t-1
+    forecast = np.concatenate([[variance], _garch_variance(r, omega, alpha, beta, variance)[:-1]])
+    return 0.5 * np.sum(np.log(forecast) + r**2 / forecast)
+
+
+def fit_garch(returns):
+    """
+    GARCH(1,1) per ticker by Gaussian maximum likelihood, with the
+    long-run variance targeted to the sample variance. Returns a frame
+    of omega/alpha/beta/variance with one row per ticker.
+    """
+    rows = {}
+    for ticker, series in _as_frame(returns).items():
+        r = series.dropna().to_numpy(dtype=float)
+        variance = float(np.var(r))
+
+        result = minimize(_garch_nll, x0=[0.08, 0.9], args=(r, variance), method="Nelder-Mead")
+        alpha, beta = result.x
+        rows[ticker] = {"omega": variance * (1 - alpha - beta), "alpha": alpha, "beta": beta,
+                        "variance": variance}
+
+    return pd.DataFrame.from_dict(rows, orient="index")
+
+
+def garch_volatility(returns, params=None):
+    params = fit_garch(returns) if params is None else params
+    frame = _as_frame(returns)
+    out = np.full(frame.shape, np.nan)
+
+    for j, (ticker, series) in enumerate(frame.items()):
+        p = params.loc[ticker]
+        valid = series.notna().to_numpy()
+        r = series.to_numpy(dtype=float)[valid]
+        out[valid, j] = _garch_variance(r, p["omega"], p["alpha"], p["beta"], p["variance"])
+
+    return _like(np.sqrt(out * TRADING_DAYS), returns)
+
+
+def volatility_history(returns, window=21, lam=EWMA_LAMBDA):
+    """Rolling, EWMA and GARCH(1,1) series side by side for one ticker's returns."""
+    return pd.DataFrame({
+        f"Rolling {window}d": rolling_volatility(returns, window),
+        "EWMA": ewma_volatility(returns, lam),
+        "GARCH(1,1)": garch_volatility(returns),
+    })
+
+
+class RollingVolatility:
+    """
+    O(1)-per-bar rolling-window estimator. r may be a scalar or an array
+    with one entry per ticker.
+    """
+
+    def __init__(self, window=21):
+        self.window = window
+        self._returns = deque()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    @classmethod
+    def from_returns(cls, returns, window=21):
+        state = cls(window)
+        for r in np.asarray(returns, dtype=float)[-window:]:
+            state.update(r)
+        return state
+
+    def update(self, r):
+        r = np.asarray(r, dtype=float)
+        self._returns.append(r)
+        self._sum = self._sum + r
+        self._sum_sq = self._sum_sq + r * r
+
+        if len(self._returns) > self.window:
+            old = self._returns.popleft()
+            self._sum = self._sum - old
+            self._sum_sq = self._sum_sq - old * old
+
+        return self.volatility
+
+    @property
+    def volatility(self):
+        n = len(self._returns)
+        if n < 2:
+            return np.nan * self._sum
+        variance = (self._sum_sq - self._sum * self._sum / n) / (n - 1)
+        return np.sqrt(np.maximum(variance, 0.0) * TRADING_DAYS)
+
+
+class EWMAVolatility:
+    """O(1)-per-bar RiskMetrics estimator, matching ewma_volatility."""
+
+    def __init__(self, lam=EWMA_LAMBDA, variance=None):
+        self.lam = lam
+        self.variance = variance
+
+    @classmethod
+    def from_returns(cls, returns, lam=EWMA_LAMBDA):
+        last = ewma_volatility(returns, lam).iloc[-1]
+        return cls(lam, np.asarray(last, dtype=float) ** 2 / TRADING_DAYS)
+
+    def update(self, r):
+        r2 = np.asarray(r, dtype=float) ** 2
+        self.variance = r2 if self.variance is None else self.lam * self.variance + (1 - self.lam) * r2
+        return self.volatility
+
+    @property
+    def volatility(self):
+        return np.sqrt(self.variance * TRADING_DAYS)
+
+
+class GARCHVolatility:
+    """O(1)-per-bar GARCH(1,1) filter, matching garch_volatility for fitted params."""
+
+    def __init__(self, omega, alpha, beta, variance):
+        self.omega = omega
+        self.alpha = alpha
+        self.beta = beta
+        self.variance = variance
+
+    @classmethod
+    def from_returns(cls, returns, params=None):
+        params = fit_garch(returns) if params is None else params
+        last = garch_volatility(returns, params).iloc[-1]
+        tickers = _as_frame(returns).columns
+
+        p = params.loc[tickers]
+        if isinstance(returns, pd.Series):
+            p = p.iloc[0]
+        return cls(np.asarray(p["omega"]), np.asarray(p["alpha"]), np.asarray(p["beta"]),
+                   np.asarray(last, dtype=float) ** 2 / TRADING_DAYS)
+
+    def update(self, r):
+        r = np.asarray(r, dtype=float)
+        self.variance = self.omega + self.alpha * r * r + self.beta * self.variance
+        return self.volatility
+
+    @property
+    def volatility(self):
+        return np.sqrt(self.variance * TRADING_DAYS)
@@ -0,0 +1,40 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from src.dataset_store import GlobalDatasetStore
+
+SNAPSHOT = "2026-10-16 15:30:00"
+
+
+def chain(tickers, strikes):
+    rows = [
+        {"ticker": ticker, "expiry": "2026-11-20", "strike": float(strike), "option_type": option_type,
+         "lastPrice": 2.5, "impliedVolatility": 0.3}
+        for ticker in tickers for strike in strikes for option_type in ("call", "put")
+    ]
+    return pd.DataFrame(rows)
+
+
+def test_concurrent_same_second_appends_keep_every_file(tmp_path):
+    store = GlobalDatasetStore(str(tmp_path))
+    # disjoint strikes: every append has rows of its own to write
+    chains = [chain(["AAPL", "MSFT"], np.arange(100, 110) + 10 * i) for i in range(8)]
+
+    with ThreadPoolExecutor(8) as pool:
+        reports = list(pool.map(lambda df: store.append_snapshot(df, 0.04, SNAPSHOT), chains))
+
+    assert sum(report["written_rows"] for report in reports) == 8 * 40
+    assert len(store.read()) == 8 * 40
+
+
+def test_concurrent_duplicate_appends_write_once(tmp_path):
+    store = GlobalDatasetStore(str(tmp_path))
+    df = chain(["AAPL", "MSFT"], np.arange(100, 110))
+
+    with ThreadPoolExecutor(8) as pool:
+        reports = list(pool.map(lambda _: store.append_snapshot(df, 0.04, SNAPSHOT), range(8)))
+
+    assert sorted(report["written_rows"] for report in reports) == [0] * 7 + [40]
+    assert len(store.read()) == 40
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+from src.batch_pricing import FIELDS, price_batch
+from src.scalar_pricing import is_scalar, price_scalar
+
+
+def random_contracts(n=2000, seed=42):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        yield (rng.uniform(10, 500), rng.uniform(10, 500), rng.uniform(1 / 365, 3),
+               rng.uniform(0.0, 0.1), rng.uniform(0.05, 1.5))
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+def test_matches_price_batch(option_type):
+    for args in random_contracts():
+        fast = price_scalar(*args, option_type)
+        slow = price_batch(*args, option_type)
+        for name in FIELDS:
+            assert fast[name] == pytest.approx(float(slow[name]), rel=1e-12, abs=1e-12), (name, args)
+
+
+@pytest.mark.parametrize("option_type", ["call", "put"])
+@pytest.mark.parametrize("S, K, T", [(100.0, 1.0, 2.0), (1.0, 100.0, 2.0), (100.0, 100.0, 1 / 365)])
+def test_matches_price_batch_in_the_tails(option_type, S, K, T):
+    fast = price_scalar(S, K, T, 0.05, 0.3, option_type)
+    slow = price_batch(S, K, T, 0.05, 0.3, option_type)
+    for name in FIELDS:
+        assert fast[name] == pytest.approx(float(slow[name]), rel=1e-12, abs=1e-12), name
+
+
+def test_degenerate_inputs_take_the_array_path():
+    assert is_scalar(100.0, 100.0, 0.5, 0.05, 0.3)
+    assert not is_scalar(100.0, 100.0, 0.0, 0.05, 0.3)
+    assert not is_scalar(100.0, 100.0, 0.5, 0.05, 0.0)
+    assert not is_scalar(np.array([100.0]), 100.0, 0.5, 0.05, 0.3)